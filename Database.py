@@ -4,8 +4,40 @@ operations are performed e.g. get a list of unique lecturers, delete double cour
 
 import os
 import ast
+import json
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.json as pj
+import pyarrow.parquet as pq
+
+# Course information columns returned by get_courses_by_person
+COURSE_DETAIL_COLUMNS = ["Kursname", "SWS", "Semester", "Veranstaltungsart", "Lehrpersonen"]
+
+# Lecturer indexes of the queried course DataFrames as id of the DataFrame -> (weak reference to the DataFrame, index),
+# the entries are removed as soon as the DataFrame is deleted
+_person_index_cache: dict[int, tuple] = {}
+
+# Arrow type of the parsed lecturer columns, a list of [name, responsibility] entries per course
+_LIST_COLUMN_SCHEMA = pa.schema([("lists", pa.list_(pa.list_(pa.string())))])
+
+# From this number of names on lecturer_format_names uses the pyarrow kernels instead of formatting name by name
+_BATCH_FORMAT_THRESHOLD = 2000
+
+# Key of the Parquet metadata entry that lists the .csv files a course data cache was built from
+_CACHE_FILES_KEY = b"csv_files"
+
+# Columns written by the scrapers; the unnamed index column in front is skipped while parsing
+COURSE_COLUMNS = [
+    "Kursname", "Fachbereich", "Zugeordnete Einrichtungen", "verantwortliche Lehrpersonen",
+    "Lehrpersonen", "Veranstaltungsart", "Kürzel", "Semester", "SWS", "Credits", "Link"
+]
 
 def read_institue_data() -> pd.DataFrame:
     """
@@ -14,12 +46,110 @@ def read_institue_data() -> pd.DataFrame:
     Returns:
         institute_df (pd.DataFrame): DataFrame with the information about the institute of each lecturer
     """
-    institute_df = pd.read_csv("Database/Insitutsliste_Goethe_Uni.csv", encoding="utf-8")
-    institute_df["Person"] = institute_df["Person"].apply(lecturer_format_name)
+    # Like the course data the formatted list is stored as Parquet file and only rebuilt if the .csv file changed
+    csv_path, cache = "Database/Insitutsliste_Goethe_Uni.csv", "Database/_institute_cache.parquet"
+    if os.path.exists(cache) and os.path.getmtime(cache) > os.path.getmtime(csv_path):
+        return pd.read_parquet(cache, engine="pyarrow").astype(pd.StringDtype("pyarrow"))
+
+    # The unnamed first column only holds the old index and is not parsed at all. The text stays pyarrow backed, so
+    # the name lookups of the Word export compare the names with the arrow kernel instead of python objects
+    institute_df = pd.read_csv(
+        csv_path, encoding="utf-8", usecols=["Person", "Institut"], dtype=pd.StringDtype("pyarrow")
+    )
+    institute_df["Person"] = pd.arrays.ArrowStringArray(
+        lecturer_format_names(pa.array(institute_df["Person"], type=pa.string()))
+    )
+    institute_df.to_parquet(cache, engine="pyarrow", compression="zstd", index=False)
 
     return institute_df
 
 
+def institute_map(institute_data: pd.DataFrame) -> dict[str, str]:
+    """
+    Converts the personal and institute list into a dictionary, so the Word export looks up the institute of a
+    lecturer in constant time instead of scanning the whole list for every document
+
+    Parameters:
+        institute_data (pd.DataFrame): DataFrame with the information about the institute of each lecturer
+
+    Returns:
+        dict[str, str]: The institute of each lecturer, the first entry is used for lecturers listed more than once
+    """
+    institute_data = institute_data.drop_duplicates("Person", keep="first")
+    return dict(zip(institute_data["Person"], institute_data["Institut"]))
+
+
+def course_data_files(link: str) -> list[str]:
+    """
+    Returns the paths of all scraped course .csv files in the scraping database directory.
+
+    Parameters:
+    link (str): Path to the scraping database directory containing .csv files.
+
+    Returns:
+    list[str]: The paths of all .csv files with course data.
+    """
+    with os.scandir(link) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith(".csv") and "veranstaltung" in entry.name.casefold()
+        ]
+
+def load_course_data(link: str, bool_empty: bool = False, cache: str | None = None) -> pd.DataFrame:
+    """
+    Loads the processed course data. The result of reading and formatting all .csv files is stored as Parquet file
+    in the database directory and is loaded directly on the next call, as long as no .csv file was changed, added,
+    removed or renamed since then.
+
+    Parameters:
+    link (str): Path to the scraping database directory containing .csv files.
+    bool_empty (bool, optional): If True, courses with no responsible lecturer are processed with fix_empty_courses.
+    cache (str, optional): Path of the Parquet cache file. Defaults to a file in the database directory.
+
+    Returns:
+    pd.DataFrame: The processed course data with pyarrow dtypes, the lecturer columns contain lists of names.
+    """
+    if cache is None:
+        cache = os.path.join(link, "_courses_cache_empty.parquet" if bool_empty else "_courses_cache.parquet")
+
+    # Only rebuild the cache if it is missing, older than one of the .csv files or built from another set of files.
+    # The file names are stored in the metadata of the cache, so deleted, renamed or copied in older files are noticed
+    csv_files = course_data_files(link)
+    csv_mtime = max((os.path.getmtime(path) for path in csv_files), default=0)
+    files_key = json.dumps(sorted(os.path.basename(path) for path in csv_files)).encode("utf-8")
+    if not os.path.exists(cache) or os.path.getmtime(cache) <= csv_mtime or cached_files_key(cache) != files_key:
+        data = read_course_data(link)
+        if bool_empty:
+            data = fix_empty_courses(data)
+        data = lecturer_format_columns(data)
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _CACHE_FILES_KEY: files_key})
+        pq.write_table(table, cache, compression="zstd")
+
+    # Also read back a freshly built cache, so the returned dtypes are always the same. The lecturer columns are
+    # list<string> columns, single values are returned as python lists
+    data = pd.read_parquet(cache, engine="pyarrow", dtype_backend="pyarrow")
+
+    # Few distinct values, as categories the semester filters compare integer codes instead of strings
+    data["Semester"] = pd.Categorical(data["Semester"], ordered=True)
+    data["Veranstaltungsart"] = data["Veranstaltungsart"].astype("category")
+    return data
+
+def cached_files_key(cache: str) -> bytes | None:
+    """
+    Returns the list of .csv files a course data cache was built from, as stored in its Parquet metadata.
+
+    Parameters:
+    cache (str): Path of the Parquet cache file.
+
+    Returns:
+    bytes | None: The JSON encoded sorted file names, None if the cache has no such entry or can not be read.
+    """
+    try:
+        return (pq.read_schema(cache).metadata or {}).get(_CACHE_FILES_KEY)
+    except (OSError, pa.ArrowInvalid):
+        return None
+
 def read_course_data(link: str)-> pd.DataFrame:
     """
     Reads and combines all .csv files from the scraping database directory.
@@ -31,11 +161,31 @@ def read_course_data(link: str)-> pd.DataFrame:
     pd.DataFrame: A concatenated DataFrame of all .csv files found in the directory,
                   or an empty DataFrame if no .csv files are found.
     """
-    dataframe = [
-        pd.read_csv(os.path.join(link, f), encoding="utf-8", index_col=0).reset_index(drop=True)
-        for f in os.listdir(link) if f.endswith(".csv") and "veranstaltung" in f.lower()
-    ]
-    return pd.concat(dataframe, ignore_index=True, sort=False) if dataframe else pd.DataFrame()
+    # Parse all columns as text (SWS as number) so the tables of the single files share one schema,
+    # "None" is treated as missing value like in pandas
+    convert_options = pv.ConvertOptions(
+        include_columns=COURSE_COLUMNS,
+        column_types={c: (pa.float64() if c == "SWS" else pa.string()) for c in COURSE_COLUMNS},
+        null_values=pv.ConvertOptions().null_values + ["None"],
+        strings_can_be_null=True
+    )
+    read_options = pv.ReadOptions(encoding="utf-8", use_threads=True)
+
+    # The files are independent and pyarrow releases the GIL while parsing, so they are read concurrently
+    paths = course_data_files(link)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(paths)))) as executor:
+        tables = list(executor.map(
+            lambda path: pv.read_csv(path, read_options=read_options, convert_options=convert_options), paths
+        ))
+    if not tables:
+        return pd.DataFrame()
+
+    # All tables share the same schema, so they are concatenated without type promotion (only the chunks are
+    # collected) and converted once into a single DataFrame. The text columns stay pyarrow backed instead of being
+    # converted into python string objects and split_blocks=True skips consolidating the columns into 2D blocks
+    return pa.concat_tables(tables).to_pandas(
+        split_blocks=True, types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get
+    )
 def lecturer_format_column(data: pd.DataFrame, column_name: str = "verantwortliche Lehrpersonen") -> pd.DataFrame:
     """
     Processes the Lehrpersonen column in the loaded DataFrame by converting the list of lecturers (string format)
@@ -50,21 +200,124 @@ def lecturer_format_column(data: pd.DataFrame, column_name: str = "verantwortlic
     Returns:
     pd.DataFrame: The modified DataFrame with formatted lecturer names and updated "SWS" values.
     """
-    # Convert string representations of lists into actual lists
-    data[column_name] = data[column_name].apply(ast.literal_eval)
+    return lecturer_format_columns(data, (column_name,))
 
-    # Ensure empty entries in the "verantwortliche Lehrpersonen" column are removed
-    if column_name == "verantwortliche Lehrpersonen":
-        data = data[data[column_name].apply(lambda x: x != [])].copy()
+def lecturer_format_columns(
+    data: pd.DataFrame,
+    column_names: tuple[str, ...] = ("verantwortliche Lehrpersonen", "Lehrpersonen")
+) -> pd.DataFrame:
+    """
+    Processes several lecturer columns like lecturer_format_column in one pass. The names of all columns are
+    formatted together, so a lecturer listed in both columns is only formatted once.
 
-    # Format each lecturer's name in the list
-    data[column_name] = data[column_name].apply(lambda row: [lecturer_format_name(entry[0]) for entry in row])
+    Parameters:
+    data (pd.DataFrame): The DataFrame of the combined scraped csv data.
+    column_names (tuple[str, ...], optional): The names of the columns containing lecturer information.
+                                              Defaults to both lecturer columns.
 
-    # Replace "None" values in the "SWS" column with 0 and ensure integer type
-    data['SWS'] = data['SWS'].replace("None", 0).fillna(0).astype(int)
+    Returns:
+    pd.DataFrame: The modified DataFrame with formatted lecturer names and updated "SWS" values.
+    """
+    # Convert string representations of lists into actual lists
+    lecturer_lists = {column_name: parse_list_column(data[column_name]) for column_name in column_names}
+
+    # Format each lecturer's name in the lists, the names of all rows and columns are formatted at once in a flat array
+    flat_names = [pc.list_element(pc.list_flatten(lists), 0) for lists in lecturer_lists.values()]
+    formatted_names = lecturer_format_names(pa.concat_arrays(flat_names))
+
+    # Split the formatted names back into the lists of the single columns
+    start = 0
+    for (column_name, lists), names in zip(lecturer_lists.items(), flat_names):
+        offsets = np.concatenate(([0], np.cumsum(pc.list_value_length(lists).to_numpy())))
+        formatted = pa.ListArray.from_arrays(
+            pa.array(offsets, type=pa.int32()), formatted_names.slice(start, len(names))
+        )
+        data[column_name] = pd.arrays.ArrowExtensionArray(formatted)
+        start += len(names)
+
+    # Replace missing values ("None" is read as missing) in the "SWS" column with 0 and truncate to integers in one
+    # pass over the numpy values, int32 is more than enough for SWS
+    data['SWS'] = np.nan_to_num(data['SWS'].to_numpy(dtype=np.float64, na_value=np.nan), nan=0).astype(np.int32)
+
+    # Ensure empty entries in the "verantwortliche Lehrpersonen" column are removed, the lengths of the parsed lists
+    # are already known, so the remaining rows are selected in a single take without an additional copy
+    if "verantwortliche Lehrpersonen" in lecturer_lists:
+        responsible = lecturer_lists["verantwortliche Lehrpersonen"]
+        data = data.take(np.flatnonzero(pc.list_value_length(responsible).to_numpy()))
 
     return data
 
+def parse_list_column(column: pd.Series) -> pa.ListArray:
+    """
+    Converts the string representations of the lecturer lists in a column into an arrow list array. The strings are
+    written by the scrapers as Python literals, after turning the single quoted strings into double quoted ones they
+    are valid JSON and the whole column is parsed at once by the pyarrow JSON reader.
+
+    Parameters:
+    column (pd.Series): The column containing the list strings, e.g. "[['Müller< Hans< Prof. Dr.', 'verantwortlich']]".
+
+    Returns:
+    pa.ListArray: The parsed lists of [name, responsibility] entries in the same order as the column.
+    """
+    literals = pc.fill_null(pa.array(column, type=pa.string(), from_pandas=True), "[]")
+    if isinstance(literals, pa.ChunkedArray):
+        literals = literals.combine_chunks()
+
+    # In rows without double quotes every single quote delimits a string and is simply swapped. Strings containing
+    # an apostrophe (e.g. "Prof'in") are already double quoted by python, only these rows need the slower regex
+    quoted = pc.match_substring(literals, '"')
+    json_lists = pc.replace_with_mask(
+        pc.replace_substring(literals, "'", '"'),
+        quoted,
+        pc.replace_substring_regex(literals.filter(quoted), r"'([^'\"]*)'", r'"\1"')
+    )
+
+    # Wrap every row in a JSON object to read the column as newline delimited JSON. The rows are stored back to back
+    # in the data buffer of the array, so the buffer is passed to the reader without creating python strings
+    lines = pc.binary_join_element_wise('{"lists": ', json_lists, "}\n", "")
+    offsets = np.frombuffer(lines.buffers()[1], dtype=np.int32)[lines.offset:lines.offset + len(lines) + 1]
+    # Escaped quotes would be valid JSON with another meaning after the swap, such columns are parsed row by row
+    if not pc.any(pc.match_substring(literals, "\\")).as_py():
+        try:
+            table = pj.read_json(
+                pa.BufferReader(lines.buffers()[2][offsets[0]:offsets[-1]]),
+                parse_options=pj.ParseOptions(explicit_schema=_LIST_COLUMN_SCHEMA)
+            )
+            return table.column("lists").combine_chunks()
+        except pa.ArrowInvalid:
+            pass
+
+    # Parse the rows one by one if some of them are no valid JSON e.g. because of escaped characters, empty cells
+    # become empty lists like in the fast path
+    return pa.array(parse_list_literals(column.fillna("[]")), type=_LIST_COLUMN_SCHEMA.field("lists").type)
+
+def parse_list_literals(column: pd.Series) -> list[list]:
+    """
+    Converts the string representations of (nested) lists in a column into actual lists row by row. After swapping
+    the quotes most of them are valid JSON and can be parsed with json.loads which is much faster than
+    ast.literal_eval.
+
+    Parameters:
+    column (pd.Series): The column containing the list strings.
+
+    Returns:
+    list[list]: The parsed lists in the same order as the column.
+    """
+    json_strings = column.str.replace("'", '"', regex=False).to_numpy()
+    parsed = []
+    for json_string, literal in zip(json_strings, column.to_numpy()):
+        # Escaped quotes would change their meaning with the swapped quotes, these literals are parsed as python
+        if "\\" in literal:
+            parsed.append(ast.literal_eval(literal))
+            continue
+        try:
+            parsed.append(json.loads(json_string))
+        except ValueError:
+            # Names with apostrophes (e.g. "Prof'in") are no valid JSON after the swap, parse the original literal
+            parsed.append(ast.literal_eval(literal))
+    return parsed
+
+@lru_cache(maxsize=None)
 def lecturer_format_name(name: str) -> str:
     """
     Formats a lecturer's name by rearranging name components split by '< '.
@@ -94,6 +347,41 @@ def lecturer_format_name(name: str) -> str:
         result_name = parts[0]
     return result_name
 
+def lecturer_format_names(names: pa.Array) -> pa.Array:
+    """
+    Batch version of lecturer_format_name, formats a whole array of lecturer names at once. Big batches are
+    formatted with pyarrow compute kernels, for small batches the fixed overhead of the kernels is higher than
+    formatting the names one by one, so lecturer_format_name is used for them.
+
+    Parameters:
+    names (pa.Array): Array of original name strings containing '< ' as a separator.
+
+    Returns:
+    pa.Array: The formatted names in the same order as the input array.
+    """
+    # The same lecturers appear in many courses, so every distinct name is only formatted once
+    encoded = pc.dictionary_encode(names)
+    if len(encoded.dictionary) < len(names):
+        return lecturer_format_names(encoded.dictionary).take(encoded.indices)
+
+    if len(names) < _BATCH_FORMAT_THRESHOLD:
+        return pa.array([None if name is None else lecturer_format_name(name) for name in names.to_pylist()],
+                        type=pa.string())
+
+    # Split all names at '< ', only keep the first three name components and strip them
+    parts = pc.list_slice(pc.split_pattern(names, "< "), 0, 3)
+    components = pc.utf8_trim_whitespace(pc.list_flatten(parts))
+
+    # Reverse the order of the components inside each name, "LastName < FirstName < Title" becomes
+    # "Title FirstName LastName"
+    offsets = np.concatenate(([0], np.cumsum(pc.list_value_length(parts).fill_null(0).to_numpy())))
+    parents = pc.list_parent_indices(parts).to_numpy()
+    reversed_positions = offsets[parents] + offsets[parents + 1] - 1 - np.arange(len(components))
+    reversed_parts = pa.ListArray.from_arrays(
+        pa.array(offsets, type=pa.int32()), components.take(pa.array(reversed_positions)), mask=pc.is_null(names)
+    )
+    return pc.binary_join(reversed_parts, " ")
+
 def lecturer_names_unique(data: pd.DataFrame) -> list[str]:
     """
     Extracts a list of unique lecturers from the 'verantwortliche Lehrpersonen' column and adds a default selection option.
@@ -104,9 +392,9 @@ def lecturer_names_unique(data: pd.DataFrame) -> list[str]:
     Returns:
     List[str]: A sorted list of unique lecturer names with 'Keine Auswahl' as the first entry.
     """
-    unique_names = sorted(set(name for sublist in data["verantwortliche Lehrpersonen"] for name in sublist))
-    unique_names.insert(0, "Keine Auswahl")
-    return unique_names
+    # The lecturer index already holds every distinct name once (like the categories of a categorical column) and is
+    # reused by the course lookups, so the list column is not scanned again
+    return ["Keine Auswahl", *sorted(index_courses_by_person(data))]
 
 def fix_empty_courses(data: pd.DataFrame) -> pd.DataFrame:
     """
@@ -119,10 +407,12 @@ def fix_empty_courses(data: pd.DataFrame) -> pd.DataFrame:
     Returns:
     pd.DataFrame: The modified DataFrame with renewed lecturer assignments.
     """
-    for index, row in data.iterrows():
-        if row["verantwortliche Lehrpersonen"] == "[]":
-            data.at[index, "verantwortliche Lehrpersonen"] = row["Lehrpersonen"]
-            data.at[index, "Lehrpersonen"] = "[]"
+    # Mark all courses without responsible lecturer, works for the list strings and for already parsed lists
+    mask = data["verantwortliche Lehrpersonen"].astype(str).eq("[]")
+
+    # Move the other lecturers of these courses to the responsible lecturers column
+    data.loc[mask, "verantwortliche Lehrpersonen"] = data.loc[mask, "Lehrpersonen"]
+    data.loc[mask, "Lehrpersonen"] = "[]"
     return data
 def get_courses_by_person(person: str, data: pd.DataFrame, semester: str) -> pd.DataFrame:
     """
@@ -136,15 +426,56 @@ def get_courses_by_person(person: str, data: pd.DataFrame, semester: str) -> pd.
      Returns:
      pd.DataFrame: A filtered DataFrame with relevant course details.
      """
-    # Filter courses where the selected person is listed in 'verantwortliche Lehrpersonen'
-    filtered_data = data[data["verantwortliche Lehrpersonen"].apply(lambda x: person in x)]
+    # Look up the courses where the selected person is listed in 'verantwortliche Lehrpersonen'
+    rows = index_courses_by_person(data).get(person, np.empty(0, dtype=np.intp))
 
-    # Further filter by semester if a specific semester is selected
+    # Further filter by semester if a specific semester is selected, only the semesters of the found rows are compared
+    # (on the codes of the categorical column)
     if semester != "Alle Semester":
-        filtered_data = filtered_data[filtered_data["Semester"] == semester]
+        rows = rows[np.asarray(data["Semester"].array[rows] == semester)]
+
+    # Select the rows and only the relevant course information columns at once, so no other columns are copied
+    return data.iloc[rows, data.columns.get_indexer(COURSE_DETAIL_COLUMNS)]
+
+def index_courses_by_person(data: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    Builds an index from each responsible lecturer to the positions of the lecturers courses in the DataFrame.
+    The index is kept as long as the DataFrame exists, so repeated queries on the same (unchanged) DataFrame do not
+    need to scan all courses.
 
-    # Return only relevant course information columns
-    return filtered_data[["Kursname", "SWS","Semester","Veranstaltungsart","Lehrpersonen"]]
+    Parameters:
+    data (pd.DataFrame): The DataFrame containing the column 'verantwortliche Lehrpersonen' with lists of names.
+
+    Returns:
+    dict[str, np.ndarray]: Maps each lecturer name to the sorted row positions of the lecturers courses.
+    """
+    data_ref, person_index = _person_index_cache.get(id(data), (None, None))
+    if data_ref is not None and data_ref() is data:
+        return person_index
+
+    # One entry per lecturer and course with the position of the course, computed by the arrow list kernels
+    lecturer_lists = pa.array(data["verantwortliche Lehrpersonen"], type=pa.list_(pa.string()), from_pandas=True)
+    names = pc.list_flatten(lecturer_lists)
+    positions = pc.list_parent_indices(lecturer_lists).to_numpy()
+    valid = pc.is_valid(names).to_numpy(zero_copy_only=False)
+    encoded = pc.dictionary_encode(names.filter(valid))
+    codes, positions = encoded.indices.to_numpy(), positions[valid]
+
+    # Sort the entries by lecturer and position and drop lecturers listed twice for the same course
+    order = np.lexsort((positions, codes))
+    codes, positions = codes[order], positions[order]
+    keep = np.ones(len(codes), dtype=bool)
+    keep[1:] = (codes[1:] != codes[:-1]) | (positions[1:] != positions[:-1])
+    codes, positions = codes[keep], positions[keep]
+
+    # Split the sorted positions into one array per lecturer
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.empty(0, dtype=np.intp)
+    lecturers = encoded.dictionary.take(pa.array(codes[starts])).to_pylist()
+    person_index = dict(zip(lecturers, np.split(positions, starts[1:])))
+
+    key = id(data)
+    _person_index_cache[key] = (weakref.ref(data, lambda _: _person_index_cache.pop(key, None)), person_index)
+    return person_index
 
 def get_unique_semester(data: pd.DataFrame) -> list[str]:
     """
@@ -156,9 +487,8 @@ def get_unique_semester(data: pd.DataFrame) -> list[str]:
     Returns:
     List[str]: A sorted list of unique semesters with 'Alle Semester' as the first entry.
     """
-    unique_semesters = sorted(set(data["Semester"]))
-    unique_semesters.insert(0, "Alle Semester")
-    return unique_semesters
+    # The categories of the semester column are already unique and sorted
+    return ["Alle Semester", *data["Semester"].astype("category").cat.categories]
 
 
 def clean_data(data: pd.DataFrame) -> pd.DataFrame:
@@ -171,9 +501,13 @@ def clean_data(data: pd.DataFrame) -> pd.DataFrame:
 
     Returns: the processed dataframe
     """
-    cleaned_data = data
-    cleaned_data = cleaned_data[cleaned_data['SWS'] != 0]
-    cleaned_data = cleaned_data[~cleaned_data['Kursname'].str.contains('entfällt', case=False, na=False)]
-    return cleaned_data
+    # Case-insensitive plain substring search (no regex) for "entfällt" in the course names with the pyarrow string
+    # kernels, pyarrow backed course names are passed to the kernels without converting them to python objects
+    course_names = pc.fill_null(pa.array(data['Kursname'], type=pa.string(), from_pandas=True), '')
+    cancelled = pc.match_substring(pc.utf8_lower(course_names), 'entfällt').to_numpy(zero_copy_only=False)
+
+    # Combine both conditions into one mask, so the data is only filtered once
+    mask = (data['SWS'].to_numpy() != 0) & ~cancelled
+    return data[mask]
 
 
@@ -5,26 +5,32 @@ Additionally, it interacts with other modules by performing data loading, proces
 """
 
 from typing import Tuple, Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 
 import pandas as pd
 import streamlit as st
 
-import scraper
+# The scrapers and the Word export are imported in the functions using them, so the app starts without loading
+# selenium, requests and python-docx
 import Database
-import toOpenOffice
-import scraper_request_bf
+
+# Shared placeholder for "no courses", it is only stored and checked but never modified
+_EMPTY_DF = pd.DataFrame()
 
 def reset_filtered_df() -> None:
     """
     Resets the stored filtered DataFrame in the Streamlit session state. This function is typically used when a
     new person is selected, ensuring that previous filter results do not persist across selections.
     """
-    st.session_state["filtered_df"] = pd.DataFrame()
+    st.session_state["filtered_df"] = _EMPTY_DF
 
-def load_data(bool_empty: bool) -> Tuple[pd.DataFrame, list[str], list[str], pd.DataFrame]:
+@st.cache_resource(ttl=3600, show_spinner=False)
+def load_data(bool_empty: bool) -> Tuple[pd.DataFrame, list[str], list[str], dict[str, str], list[str]]:
     """
-    Loads the current data and returns it.
+    Loads the current data and returns it. The result is cached for each value of bool_empty, so the reruns of the
+    app do not read and process the data again. The cached objects are shared and not copied, so they must not be
+    modified.
 
     Parameters:
         bool_empty (bool): True, when selectbox 3 is selected. If true then combines "Lehrpersonen" und
@@ -34,13 +40,21 @@ def load_data(bool_empty: bool) -> Tuple[pd.DataFrame, list[str], list[str], pd.
             - current_data (pd.Dataframe): The current data loaded from the .csv scraped data directory.
             - unique_names (list[str]): The list of unique lecturer names.
             - unique_semesters (list[str]): The list of unique available semesters.
-            - institute_data (pd.DataFrame): Dataframe with the institute Data for each lecturer
+            - institute_data (dict[str, str]): The institute of each lecturer
+            - unique_names_with_all (list[str]): The lecturer names with "Alle" instead of "Keine Auswahl" for the
+              multi export selection.
     """
     current_data, unique_names, unique_semesters = refresh_data(bool_empty)
 
-    institute_data = Database.read_institue_data()
+    # Lecturer selection of the multi export, built once with the cached data instead of on every rerun
+    unique_names_with_all = ["Alle", *unique_names[1:]]
+
+    institute_data = Database.institute_map(Database.read_institue_data())
+
+    # Build the lecturer index once with the data, so the first course lookup does not need to scan all courses
+    Database.index_courses_by_person(current_data)
 
-    return current_data, unique_names, unique_semesters, institute_data
+    return current_data, unique_names, unique_semesters, institute_data, unique_names_with_all
 
 
 def refresh_data(bool_empty: bool) -> Tuple[pd.DataFrame, list[str], list[str]]:
@@ -56,16 +70,9 @@ def refresh_data(bool_empty: bool) -> Tuple[pd.DataFrame, list[str], list[str]]:
             - unique_names (list[str]): A list of unique lecturer names.
             - unique_semesters (list[str]): A list of unique semesters.
     """
-    # Load course data from the database
-    get_data = Database.read_course_data("Database/")
+    # Load the formatted course data from the database, optionally with processed empty courses
+    get_data = Database.load_course_data("Database/", bool_empty)
     print("refreshed")
-    # Optionally process empty courses if enabled
-    if bool_empty == True:
-        get_data = Database.fix_empty_courses(get_data)
-
-    # Format the lecturer columns to ensure consistent data
-    get_data = Database.lecturer_format_column(get_data)
-    get_data = Database.lecturer_format_column(get_data, column_name="Lehrpersonen")
 
     # Extract unique lecturer names and semester values
     unique_name = Database.lecturer_names_unique(get_data)
@@ -110,34 +117,35 @@ def display_filters(unique_names: list[str], unique_semesters: list[str]) -> Tup
     return semester, selected_name
 
 
-def display_courses(selected_name: str, semester: str, current_data: pd.DataFrame, data_clean: bool, institute_data: pd.DataFrame) -> None:
+@st.fragment
+def display_courses(selected_name: str, semester: str, current_data: pd.DataFrame, data_clean: bool, institute_data: dict[str, str]) -> None:
     """
     Retrieves and displays the filtered course catalog for the selected lecturer as table in the GUI.
     This function fetches courses from the database, applies optional data cleaning,
     and displays the results in an interactive table. It also supports real-time updates
     when selections change and provides an export option.
+    Runs as fragment, so editing the table or pressing the export button only reruns this function and not the
+    whole app.
 
     Parameters:
         selected_name (str): The name of the selected lecturer.
         semester (str): The selected semester.
         current_data (pd.Dataframe): The dataset containing all scraped course information.
         data_clean (bool): If True, the data will be cleaned before display.
-        institute_data (pd.DataFrame): Dataset containing lecturer institute data
+        institute_data (dict[str, str]): The institute of each lecturer
 
     Returns:
         None
     """
 
-    # Initialize session state variables if they do not exist
-    session_vars = ["filtered_df", "raw_filtered_df", "last_clean_state", "last_selected_name"]
-    for var in session_vars:
-        if var not in st.session_state:
-            st.session_state[var] = pd.DataFrame() if "df" in var else None
+    # Initialize the session state variable for the displayed table if it does not exist
+    if "filtered_df" not in st.session_state:
+        st.session_state["filtered_df"] = _EMPTY_DF
 
-    # Fetch course data if a lecturer is selected
+    # Fetch course data if a lecturer is selected. The lookup in the shared dataset is cheap, so it is repeated on
+    # every rerun instead of keeping the unprocessed data and the last selection in the session state
     if selected_name != "Keine Auswahl":
         raw_df = Database.get_courses_by_person(selected_name, current_data, semester)
-        st.session_state["raw_filtered_df"] = raw_df  # Store unprocessed data
 
         # Apply data cleaning if enabled
         filtered_df = Database.clean_data(raw_df) if data_clean else raw_df
@@ -147,51 +155,34 @@ def display_courses(selected_name: str, semester: str, current_data: pd.DataFram
             st.session_state["filtered_df"] = filtered_df
         else:
             st.warning("Keine Kurse für diese Person gefunden.")
-            st.session_state["filtered_df"] = pd.DataFrame()
-
-        # Store current selection state to avoid redundant processing
-        st.session_state["last_clean_state"] = data_clean
-        st.session_state["last_selected_name"] = selected_name
-
-    # Automatically update filtered data if selection or cleaning option changes
-    if "raw_filtered_df" in st.session_state:
-        if (st.session_state["last_clean_state"] != data_clean or
-                st.session_state["last_selected_name"] != selected_name):
-            raw_df = st.session_state["raw_filtered_df"]
-            filtered_df = Database.clean_data(raw_df) if data_clean else raw_df
-
-            st.session_state["filtered_df"] = filtered_df
-            st.session_state["last_clean_state"] = data_clean
-            st.session_state["last_selected_name"] = selected_name
+            st.session_state["filtered_df"] = _EMPTY_DF
 
     # Display filtered courses if available
     if not st.session_state["filtered_df"].empty and selected_name != "Keine Auswahl":
         st.write(f"Kurse von **{selected_name}**:")
 
-        # Interactive table for editing and deleting rows
+        # Interactive table for editing and deleting rows. Streamlit keeps the edits under the key and applies them
+        # to the returned DataFrame, the key changes with the selection, so old edits are not applied to other courses
         edited_df = st.data_editor(
             st.session_state["filtered_df"],
+            key=f"editor_{selected_name}_{semester}_{data_clean}",
             num_rows="dynamic",  # Allow row deletion
             hide_index=True
         )
 
-        # Update session state if the table is modified
-        if not edited_df.equals(st.session_state["filtered_df"]):
-            st.session_state["filtered_df"] = edited_df
-
         # Word export button activates word export function with corresponding data
-        word_export(selected_name, semester, st.session_state["filtered_df"], data_clean,institute_data)
+        word_export(selected_name, semester, edited_df, institute_data)
 
-def word_export(person: str, semester: str, filtered_df: pd.DataFrame,data_clean: bool,institute_data: pd.DataFrame) -> None:
+def word_export(person: str, semester: str, filtered_df: pd.DataFrame,institute_data: dict[str, str]) -> None:
     """
       Exports the filtered course data for the selected lecturer and semester as a Word document.
 
       Parameters:
           person (str): The name of the selected lecturer.
           semester (str): The selected semester.
-          filtered_df (pd.Dataframe): The filtered dataset containing relevant course information for the selections.
-          data_clean (bool): True if data clean option is selected.
-          institute_data (pd.DataFrame): Dataframe containing lecturers institute data
+          filtered_df (pd.Dataframe): The filtered dataset containing relevant course information for the selections,
+          already cleaned by display_courses if the data clean option is selected.
+          institute_data (dict[str, str]): The institute of each lecturer
 
       Returns:
           None
@@ -199,10 +190,8 @@ def word_export(person: str, semester: str, filtered_df: pd.DataFrame,data_clean
 
     # Button to trigger Word export
     if st.button("Daten als Word exportieren"):
-        # If data clean option is selected clean data before export
-        if data_clean == True:
-            filtered_df = Database.clean_data(filtered_df)
         # Call the Word export function and if success, show success messages
+        import toOpenOffice
         toOpenOffice.fill_word(person,semester,filtered_df,institute_data)
         st.success("Daten wurden exportiert!")
         st.info("Alle Exporte werden im zugehörigen Python-Verzeichnis im 'Word_Exporte' Ordner gespeichert")
@@ -214,7 +203,7 @@ def word_export_all(
     semester: str,
     current_data: pd.DataFrame,
     data_clean: bool,
-    institute_data: pd.DataFrame
+    institute_data: dict[str, str]
 ) -> None:
     """
     Exports course data for multiple selected lecturers as Word documents. Also shows live export progress.
@@ -225,7 +214,7 @@ def word_export_all(
         semester (str): The selected semester.
         current_data (pd.Dataframe): The dataset containing course information.
         data_clean (bool): If True, courses are processed before export.#
-        institute_data(pd.DataFrame): Dataset containing lecturer institute information
+        institute_data(dict[str, str]): The institute of each lecturer
 
     Returns:
         None
@@ -233,23 +222,17 @@ def word_export_all(
     # Button to trigger Word export
     if st.button("Daten als Word Exportieren"):
 
-        # Intialize counter for progress bar
-        progress_counter = 0
+        # Clean the whole dataset once instead of the courses of every single lecturer, the cleaning only removes
+        # single rows, so the courses of each lecturer are the same as with cleaning after the lookup
+        if data_clean == True:
+            current_data = Database.clean_data(current_data)
 
         # Export for all lecturers if "Alle" is selected
         if selected_names == ["Alle"]:
             # Define progress bar
             st.subheader("Daten werden exportiert...")
             progress_bar = st.progress(0)
-            for name in all_names:
-                progress_counter += 1
-                if data_clean == True:
-                    toOpenOffice.fill_word(name, semester, Database.clean_data(Database.get_courses_by_person(name, current_data, semester)),institute_data)
-                else:
-                    toOpenOffice.fill_word(name, semester, Database.get_courses_by_person(name, current_data, semester),institute_data)
-
-                # refresh progress
-                progress_bar.progress(progress_counter/len(all_names))
+            export_words(all_names, semester, current_data, institute_data, progress_bar)
 
             # Display success message
             st.success("Daten wurden exportiert!")
@@ -260,16 +243,7 @@ def word_export_all(
             # Define progress bar
             st.subheader("Daten werden exportiert...")
             progress_bar = st.progress(0)
-            for name in selected_names:
-                progress_counter += 1
-                if data_clean == True:
-                    toOpenOffice.fill_word(name, semester, Database.clean_data(Database.get_courses_by_person(name, current_data, semester)),institute_data)
-                else:
-                    toOpenOffice.fill_word(name, semester, Database.get_courses_by_person(name, current_data, semester),institute_data)
-
-                # refresh progress
-                progress_bar.progress(progress_counter/len(selected_names))
-
+            export_words(selected_names, semester, current_data, institute_data, progress_bar)
 
             # Display success message
             st.success("Daten wurden exportiert!")
@@ -278,6 +252,69 @@ def word_export_all(
         else:
             st.error("Bitte eine oder mehrere Lehrpersonen auswählen")
 
+def export_words(
+    names: list[str],
+    semester: str,
+    current_data: pd.DataFrame,
+    institute_data: dict[str, str],
+    progress_bar: Any
+) -> None:
+    """
+    Creates the Word documents of the given lecturers in parallel worker processes. The progress bar and the status
+    box are refreshed in steps of one percent, so a large export does not send a message per document.
+
+    Parameters:
+        names (List[str]): The names of the lecturers to export.
+        semester (str): The selected semester.
+        current_data (pd.Dataframe): The dataset containing course information.
+        institute_data(dict[str, str]): The institute of each lecturer
+        progress_bar (Any): The streamlit progress bar showing the export progress.
+
+    Returns:
+        None
+    """
+    # The documents are independent and python-docx holds the GIL, so processes are used instead of threads. The
+    # institute data is sent once to every worker, with each document only the courses of the lecturer are sent
+    import toOpenOffice
+    with ProcessPoolExecutor(initializer=toOpenOffice.init_export_worker, initargs=(institute_data,)) as executor:
+        futures = [
+            executor.submit(
+                toOpenOffice.export_word, name, semester, Database.get_courses_by_person(name, current_data, semester)
+            )
+            for name in names
+        ]
+
+        # refresh progress in the order the documents are finished, an update is only sent when the integer
+        # percentage advances, so there are at most 100 updates independent of the number of documents
+        status = st.status("Word Dateien werden erstellt...", expanded=False)
+        last_percent = -1
+        for progress_counter, future in enumerate(as_completed(futures), start=1):
+            future.result()
+            percent = progress_counter * 100 // len(names)
+            if percent != last_percent:
+                progress_bar.progress(percent)
+                status.update(label=f"{progress_counter}/{len(names)} Word Dateien erstellt")
+                last_percent = percent
+        status.update(state="complete")
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_semester_list(scraping_tool: str) -> list[str]:
+    """
+    Scrapes the available semesters from the QIS site with the selected scraping tool. The list is cached for ten
+    minutes, so the site is not requested again on every rerun while the scraping tools are activated.
+
+    Parameters:
+        scraping_tool (str): "selenium" for the selenium scraper, otherwise the requests scraper is used.
+
+    Returns:
+        list[str]: The available semesters.
+    """
+    if scraping_tool == "selenium":
+        import scraper
+        return scraper.get_semester_list()
+    import scraper_request_bf
+    return scraper_request_bf.get_semester_list()
+
 def scrape_buttons():
     """
     Creates scraping-related checkboxes and selection options in the sidebar. Scrapes the available semesters from
@@ -308,9 +345,11 @@ def scrape_buttons():
             # Try to load the semester list, if not possible show error. In loading time show load bar
             try:
                 if scraping_aktiviert:
-                    semester_list = scraper.get_semester_list()
+                    import scraper
+                    semester_list = get_semester_list("selenium")
                 elif scraping_requests:
-                    semester_list = scraper_request_bf.get_semester_list()
+                    import scraper_request_bf
+                    semester_list = get_semester_list("requests")
                 placeholder.empty()  # Deletes the load button
                 semester = st.selectbox("Wähle ein Semester:", semester_list, key="scrape_select_semester")
                 # Scraping starts, when the button is pressed
@@ -320,11 +359,13 @@ def scrape_buttons():
                         if scraping_aktiviert:
                             startzeit = time.perf_counter()
                             scraper.scrape_semester(semester)
+                            load_data.clear()  # Neue Daten beim nächsten Lauf laden
                             endzeit = time.perf_counter()
                             print(endzeit - startzeit)
                         elif scraping_requests:
                             startzeit = time.perf_counter()
                             scraper_request_bf.scrape_semester(semester)
+                            load_data.clear()  # Neue Daten beim nächsten Lauf laden
                             endzeit = time.perf_counter()
                             print(endzeit - startzeit)
                 # If the other button is pressed personal and institute list will be scraped
@@ -334,11 +375,13 @@ def scrape_buttons():
                         if scraping_aktiviert:
                             startzeit = time.perf_counter()
                             scraper.scrape_personal()
+                            load_data.clear()  # Neue Daten beim nächsten Lauf laden
                             endzeit = time.perf_counter()
                             print(endzeit - startzeit)
                         elif scraping_requests:
                             startzeit = time.perf_counter()
                             scraper_request_bf.scrape_personal()
+                            load_data.clear()  # Neue Daten beim nächsten Lauf laden
                             endzeit = time.perf_counter()
                             print(endzeit - startzeit)
             except Exception as e:
@@ -363,21 +406,28 @@ def checkbox_empty_courses() -> bool:
                                 help="Standardmäßig wird eine Lehrperson nur dann als verantwortliche Person einer Lehrveranstaltung zugewiesen, wenn sie im QIS als 'verantwortlich' hinterlegt ist. Wird dieses Feld aktiviert, werden bei Veranstaltungen ohne explizit verantwortliche Personen im QIS die übrigen angegebenen Lehrpersonen als verantwortlich gesetzt.")
     return empty_courses
 
+# Reduce top padding for better layout
+_PAGE_CSS = """
+<style>
+/* Reduziert den oberen Abstand der gesamten Streamlit-App */
+.block-container {
+    padding-top: 45px !important;
+}
+</style>
+"""
+
+@st.cache_resource
+def load_logo() -> bytes:
+    """Reads the logo once, the following reruns reuse the bytes instead of reading the file again."""
+    with open("GoetheUniLogo.png", "rb") as logo_file:
+        return logo_file.read()
+
 def add_title_logo() -> None:
-    """Adds a title and logo to the Streamlit app with adjusted padding."""
-
-    # Reduce top padding for better layout
-    st.markdown(
-        """
-        <style>
-        /* Reduziert den oberen Abstand der gesamten Streamlit-App */
-        .block-container {
-            padding-top: 45px !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    """
+    Adds a title and logo to the Streamlit app with adjusted padding. Streamlit removes all elements which are not
+    written again in a rerun, so the elements are still added on every run, only the CSS and the logo are prepared once.
+    """
+    st.markdown(_PAGE_CSS, unsafe_allow_html=True)
 
     # Create layout with title and logo
     col_logo, col_title = st.columns([4, 1])
@@ -387,7 +437,7 @@ def add_title_logo() -> None:
                                                      "wo sie zu einem pandas DataFrame kombiniert werden. Nutzende können für jede Lehrperson eine Datei erstellen, die alle von ihr verantworteten Veranstaltungen enthält. "
                                                      "Dafür stehen verschiedene Optionen zur Verfügung, darunter Mehrfachauswahl, die Auswahl eines bestimmten Semesters und weitere Filtermöglichkeiten.")
     with col_title:
-        st.image("GoetheUniLogo.png", width=150)
+        st.image(load_logo(), width=150)
 
 def run_gui() -> None:
     """
@@ -413,23 +463,9 @@ def run_gui() -> None:
     empty_course_check = checkbox_empty_courses()
 
 
-    if "data_loaded" not in st.session_state:
-        # Intialize the data when no data was loaded before
-        current_data, unique_names, unique_semesters, institute_data = load_data(empty_course_check)
-        st.session_state.data_loaded = (current_data, unique_names, unique_semesters, institute_data)
-        st.session_state.prev_empty_course_check = empty_course_check
-    else:
-        # If the empty course checkbox changes, reload the data with empty course check = 1
-        if empty_course_check != st.session_state.prev_empty_course_check:
-            current_data, unique_names, unique_semesters, institute_data = load_data(empty_course_check)
-            st.session_state.data_loaded = (current_data, unique_names, unique_semesters, institute_data)
-            st.session_state.prev_empty_course_check = empty_course_check
-        else:
-            # Else use the already loaded data
-            current_data, unique_names, unique_semesters, institute_data = st.session_state.data_loaded
-
-    # Data load operation at the start, also loads lists for available semester and lecturers
-    unique_names_with_all = ["Alle"] + unique_names[1:]
+    # Data load operation at the start, also loads lists for available semester and lecturers. Only the first call for
+    # each state of the empty course checkbox reads the database
+    current_data, unique_names, unique_semesters, institute_data, unique_names_with_all = load_data(empty_course_check)
 
     # **Export mode enabled: Multi-person export**
     if export_mode:
@@ -462,7 +498,9 @@ def run_gui() -> None:
             scrape_buttons()
 
 
-run_gui()
+# Streamlit runs the script as __main__, the guard keeps the export worker processes from starting the GUI again
+if __name__ == "__main__":
+    run_gui()
 
 
 
@@ -0,0 +1,106 @@
+"""
+Response cache and request limit of the QIS scrapers, shared by scraper.py and scraper_request_bf.py.
+Each page is stored under the sha1 hash of its normalized url, the html in <hash>.html and the cache headers in
+<hash>.json. Cached pages are revalidated with their ETag or Last-Modified header, so unchanged pages are answered by
+the server with 304 Not Modified and read from disk instead of being downloaded again.
+"""
+
+import os
+import json
+import hashlib
+from typing import Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Maximum number of pages both scrapers download from the QIS server at the same time, kept small so the server is
+# not flooded with requests
+MAX_CONCURRENT_REQUESTS = 8
+
+# Directory of the response cache
+RESPONSE_CACHE_DIR = ".qis_cache"
+# Query parameters that only belong to the session and do not change the page
+SESSION_QUERY_PARAMETERS = frozenset({"asi"})
+
+def normalize_url(url: str) -> str:
+    """
+    Removes the session parameters and the fragment from an url, so the same page always has the same cache key.
+
+    Parameters:
+        url (str): The URL of a QIS page.
+
+    Returns:
+        str: The normalized URL.
+    """
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SESSION_QUERY_PARAMETERS]
+    return urlunsplit(parts._replace(query=urlencode(query), fragment=""))
+
+def cached_response_path(url: str) -> str:
+    """
+    Returns the path of a page in the response cache without file extension.
+
+    Parameters:
+        url (str): The URL of the page.
+
+    Returns:
+        str: The path, the html is stored in <path>.html and the cache headers in <path>.json.
+    """
+    return os.path.join(RESPONSE_CACHE_DIR, hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest())
+
+def read_cached_response(url: str) -> Tuple[dict | None, bytes | None]:
+    """
+    Reads a page from the response cache.
+
+    Parameters:
+        url (str): The URL of the page.
+
+    Returns:
+        Tuple[dict | None, bytes | None]: The cache headers (ETag and Last-Modified) and the html of the page,
+        (None, None) if the page is not cached.
+    """
+    path = cached_response_path(url)
+    try:
+        with open(path + ".json", encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        with open(path + ".html", "rb") as html_file:
+            return meta, html_file.read()
+    except (OSError, ValueError):
+        return None, None
+
+def write_cached_response(url: str, etag: str | None, last_modified: str | None, html: bytes) -> None:
+    """
+    Writes a downloaded page to the response cache. The files are replaced atomically, so parallel scraping processes
+    never read half written entries.
+
+    Parameters:
+        url (str): The URL of the page.
+        etag (str | None): The ETag header of the response.
+        last_modified (str | None): The Last-Modified header of the response.
+        html (bytes): The html of the page.
+    """
+    os.makedirs(RESPONSE_CACHE_DIR, exist_ok=True)
+    path = cached_response_path(url)
+    temp_suffix = f".{os.getpid()}.tmp"
+    with open(path + ".html" + temp_suffix, "wb") as html_file:
+        html_file.write(html)
+    os.replace(path + ".html" + temp_suffix, path + ".html")
+    with open(path + ".json" + temp_suffix, "w", encoding="utf-8") as meta_file:
+        json.dump({"etag": etag, "last_modified": last_modified}, meta_file)
+    os.replace(path + ".json" + temp_suffix, path + ".json")
+
+def conditional_headers(meta: dict | None) -> dict:
+    """
+    Builds the validation headers of a conditional GET from the cache headers of a page.
+
+    Parameters:
+        meta (dict | None): The cache headers of the page, None if the page is not cached.
+
+    Returns:
+        dict: If-None-Match and If-Modified-Since if known, empty otherwise.
+    """
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
@@ -5,27 +5,102 @@ Data is stored as CSV files in the `Database/` folder.
 """
 
 import os
-from datetime import datetime
-from typing import List, Tuple
-
+import csv
+import time
+import random
+import asyncio
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+
+import aiohttp
+import lxml.etree
+import lxml.html
 import pandas as pd
-from urllib3.exceptions import ReadTimeoutError
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from response_cache import MAX_CONCURRENT_REQUESTS, conditional_headers, read_cached_response, write_cached_response
+
+# Folder of the result csv files, it is created once when the module is loaded
+DB_DIR = pathlib.Path("Database")
+DB_DIR.mkdir(exist_ok=True)
+
+# Start page of the QIS, the semester is selected from here
+QIS_START_URL = "https://qis.server.uni-frankfurt.de/qisserver/rds?state=user&type=0"
+
+# Maximum number of seconds a semester process waits before it starts its browser in scrape_all
+START_JITTER_SECONDS = 10
+
+# Number of course pages that are downloaded before their rows are written to the csv file
+CHECKPOINT_SIZE = 200
+
+# Resources the browser does not need to download for scraping
+BLOCKED_RESOURCES = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.woff", "*.woff2", "*.ttf"]
+
+# Returns [url, title] of the deeper links (a.ueb) and of the course links (a.regular) of the current page, the url is
+# resolved like the href attribute of Selenium
+FIND_LINKS_SCRIPT = """
+const links = selector => Array.from(
+    document.querySelectorAll(selector), a => [a.hasAttribute("href") ? a.href : null, a.getAttribute("title")]
+);
+return [links("a.ueb"), links("a.regular")];
+"""
+
+# Returns the urls of all elements with the class "ueb" (the faculty links of the personal page)
+UEB_LINKS_SCRIPT = 'return Array.from(document.getElementsByClassName("ueb"), a => a.href);'
+
+# The QIS pages are utf-8 encoded, lxml would otherwise guess the encoding of pages without charset declaration
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# Translation tables for the scraped texts, each text is sanitized in a single pass. Semicolons become commas, in
+# course titles both become "-" and in person names both become "<", the separator of the name parts
+SANITIZE_SEMICOLON = str.maketrans({";": ","})
+SANITIZE_TITLE = str.maketrans({";": "-", ",": "-"})
+SANITIZE_PERSON = str.maketrans({";": "<", ",": "<"})
+
+# Fields of the "Grunddaten zur Veranstaltung" table that are scraped, in the order of the result columns
+GRUNDDATEN_FIELDS = ("Veranstaltungsart", "Kürzel", "Semester", "SWS", "Credits")
+GRUNDDATEN_FIELD_SET = frozenset(GRUNDDATEN_FIELDS)
+
+# Selenium XPath of the semester entry in the semester dropdown, the semester name is inserted with format
+SEMESTER_LINK_XPATH = "//a[contains(text(), '{}')]"
+
+# XPaths of the course and profile pages, compiled once at import and reused for every parsed page
+XPATH_H1 = lxml.etree.XPath('//h1')
+XPATH_FACHBEREICHE = lxml.etree.XPath('//div[contains(@style, "padding-left: 10px")]/a')
+XPATH_EINRICHTUNGEN = lxml.etree.XPath('//table[@summary="Übersicht über die zugehörigen Einrichtungen"]//td/a')
+XPATH_DOZENTEN_TABLES = lxml.etree.XPath('//table[@summary="Verantwortliche Dozenten"]')
+XPATH_GRUNDDATEN_TABLES = lxml.etree.XPath('//table[@summary="Grunddaten zur Veranstaltung"]')
+XPATH_ROWS = lxml.etree.XPath('.//tr')
+XPATH_PERSON = lxml.etree.XPath('./td[@headers="persons_1"]/a')
+XPATH_RESPONSIBILITY = lxml.etree.XPath('./td[@headers="persons_2"]')
+XPATH_HEADERS = lxml.etree.XPath('.//th')
+XPATH_VALUES = lxml.etree.XPath('.//td')
+XPATH_UEB_LINKS = lxml.etree.XPath('//a[contains(concat(" ", normalize-space(@class), " "), " ueb ")]')
+XPATH_REGULAR_LINKS = lxml.etree.XPath('//a[contains(concat(" ", normalize-space(@class), " "), " regular ")]')
+XPATH_PERSON_LINKS = lxml.etree.XPath('//a[contains(concat(" ", normalize-space(@class), " "), " ver ")]/@href')
+# The header is passed as XPath variable, e.g. XPATH_PERSON_FIELD(tree, header="Nachname")
+XPATH_PERSON_FIELD = lxml.etree.XPath('//th[contains(text(), $header)]/following-sibling::td')
+XPATH_INSTITUTE = lxml.etree.XPath('//div[contains(@style, "padding-left: 20px")]/a')
+
 
 # Function to start the WebDriver
-def start_driver(url: str = "https://qis.server.uni-frankfurt.de/qisserver/rds?state=user&type=0") -> webdriver.Chrome:
+def start_driver(
+    url: str = QIS_START_URL,
+    cache_dir: str = "~/.qis_chrome_cache"
+) -> webdriver.Chrome:
     """
     Initializes and starts a headless Chrome WebDriver instance.
 
     Parameters:
         url (str, optional): The URL to open in the WebDriver. Defaults to the Goethe University course lecture site.
+        cache_dir (str, optional): Directory of the http cache of the browser, browsers running at the same time
+                                   need different directories.
 
     Returns:
         webdriver.Chrome: The initialized WebDriver instance with the requested page loaded.
@@ -35,9 +110,18 @@ def start_driver(url: str = "https://qis.server.uni-frankfurt.de/qisserver/rds?s
     options.add_argument("--disable-gpu")  # Disable GPU for stability (optional)
     options.add_argument("--no-sandbox")  # For Linux systems (optional)
     options.add_argument("--disable-extensions")  # Disable extensions
+    # Keep the http cache of the browser between the runs, the catalog pages share their scripts, styles and images
+    options.add_argument(f"--disk-cache-dir={os.path.expanduser(cache_dir)}")
+    options.add_argument("--disk-cache-size=536870912")  # 512 MB
 
     driver = webdriver.Chrome(options=options)
-    driver.set_page_load_timeout(5)  # Set page load timeout (in seconds)
+    # Set page load timeout (in seconds), slow directory pages often need more than 5 seconds and were skipped before
+    driver.set_page_load_timeout(15)
+
+    # Only text and links are read, so images and fonts are not downloaded. Stylesheets are still loaded, the clicks
+    # in get_course_catalog need the elements to be displayed like on the normal page
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCES})
     driver.get(url)  # Open the specified URL
 
     return driver
@@ -58,10 +142,9 @@ def get_course_catalog(semester_name: str, driver: WebDriver) -> str:
     semester_dropdown.click()
 
     # Wait for the semester options to be visible and select the appropriate one
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.XPATH, f"//a[contains(text(), '{semester_name}')]"))
+    selected_semester_option = WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable((By.XPATH, SEMESTER_LINK_XPATH.format(semester_name)))
     )
-    selected_semester_option = driver.find_element(By.XPATH, f"//a[contains(text(), '{semester_name}')]")
     selected_semester_option.click()
 
     # Select the "Veranstaltungen" section
@@ -79,85 +162,181 @@ def get_course_catalog(semester_name: str, driver: WebDriver) -> str:
     # Return the final catalog URL
     return driver.current_url
 
-def dfs_course_catalog(catalog_url: str, driver: WebDriver, semester: str) -> int:
+def bfs_course_catalog(catalog_url: str, driver: WebDriver, semester: str, refresh: bool = False) -> int:
     """
-    Performs a depth-first search on the course catalog website, extracting course data and saving it to a CSV file.
+    Performs a breadth-first search on the course catalog website, extracting course data and saving it to a CSV file.
 
     Parameters:
         catalog_url (str): The URL of the course catalog page to scrape.
         driver (WebDriver): The Selenium WebDriver instance used for navigation and data extraction.
         semester (str): Current semester that is scraped
+        refresh (bool, optional): Download all pages again instead of using the response cache.
 
     Returns:
         int: Always returns 0 upon completion.
     """
-    # Initialize DataFrame for result export
-    result_dataframe = pd.DataFrame(columns=[
+    # Columns of the result export
+    columns = [
         'Kursname', 'Fachbereich', 'Zugeordnete Einrichtungen', 'verantwortliche Lehrpersonen',
         'Lehrpersonen', 'Veranstaltungsart', "Kürzel", "Semester", "SWS", "Credits", "Link"
-    ])
-
-    # Lists for visited and unvisited links, important so no urls will be opened twice
-    open_link_list = []
-    closed_link_list = []
-
-    # Initialize first search so that open_link_list is not empty
-    current_links = find_links_onsite(driver)
-    open_link_list.extend(current_links)
-
-    while open_link_list != []:
-        # Check if the last link is unvisited and a veranstaltung indicated by the "r"
-        if open_link_list[-1][1] == "r" and open_link_list[-1][0] not in closed_link_list:
-            data_visit = open_link_list.pop()[0]
+    ]
+
+    # The rows are appended to a partial file while scraping, so an aborted run can be continued. Only courses in the
+    # partial file of an aborted run are not scraped again, a finished semester is always scraped completely. The
+    # partial file does not end with .csv, so Database does not load it as course data
+    csv_path = DB_DIR / f"{semester.replace('/', '_')}_GoetheUni_Veranstaltungen.csv"
+    partial_path = csv_path.with_name(csv_path.name + ".partial")
+    scraped_link_set = set()
+    new_file = not os.path.exists(partial_path) or os.path.getsize(partial_path) == 0
+    if not new_file:
+        with open(partial_path, newline="", encoding="utf-8") as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader)
+            link_position = header.index("Link")
+            for row in reader:
+                scraped_link_set.add(row[link_position])
+
+    # Set of all links found so far, important so no urls will be opened twice. Links are only added to the next level
+    # when they are found for the first time, so every directory link is visited once
+    found_link_set = set()
+
+    # The course pages are static html, so they are the leaves of the tree and are only collected during the search.
+    # They are downloaded concurrently afterwards
+    course_link_list = []
+
+    def add_new_links(directory_links: list[str], course_links: list[str], next_level: list[str]) -> None:
+        for new_link in directory_links:
+            if new_link not in found_link_set:
+                found_link_set.add(new_link)
+                next_level.append(new_link)
+        for new_link in course_links:
+            if new_link not in found_link_set:
+                found_link_set.add(new_link)
+                course_link_list.append(new_link)
+
+    # The catalog root is already opened in the browser, it is searched first
+    level = []
+    add_new_links(*find_links_onsite(driver), level)
+
+    # The directory pages are static html as well, so the tree is searched level by level. All directories of a level
+    # are downloaded concurrently with the session cookies of the driver, so the selected semester is kept
+    cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+    while level:
+        directory_pages = asyncio.run(fetch_pages(level, cookies, refresh))
+        next_level = []
+        for link, html in zip(level, directory_pages):
+            print(link)
+            if html is None:
+                continue  # Ignore timeout errors and continue
+            # Now find all relevant urls to other "nodes" of the tree or to all other branches of the course directory
             try:
-                driver.get(data_visit)
-            except (TimeoutException, ReadTimeoutError):
-                pass  # Ignore timeout errors and continue
-            print(data_visit)
+                page_links = find_links_in_page(html, link)
+            except lxml.etree.LxmlError as e:
+                print(f"Error parsing {link}: {e}")
+                continue  # Ignore empty or broken pages and continue
+            add_new_links(*page_links, next_level)
+        level = next_level
+
+    # Download the course pages, which are not in the partial file of an aborted run already
+    course_link_list = [link for link in course_link_list if link not in scraped_link_set]
+
+    with open(partial_path, "a", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        if new_file:
+            writer.writerow(columns)
+
+        # The pages are downloaded in checkpoints, the rows of each checkpoint are written to disk before the next one
+        # is loaded, so at most one checkpoint of pages is kept in memory and lost on a crash
+        for start in range(0, len(course_link_list), CHECKPOINT_SIZE):
+            checkpoint_links = course_link_list[start:start + CHECKPOINT_SIZE]
+            course_pages = asyncio.run(fetch_pages(checkpoint_links, cookies, refresh))
+
+            # Fetch the course data of each loaded page and append the result to the csv file
+            for data_visit, html in zip(checkpoint_links, course_pages):
+                print(data_visit)
+                if html is None:
+                    continue  # Ignore timeout errors and continue
+                try:
+                    row = get_course_data(html) + [data_visit]
+                except (IndexError, lxml.etree.LxmlError):
+                    continue  # Ignore empty pages and pages without title or person links and continue
+                # Pages with missing fields do not fit the columns and are skipped
+                if len(row) == len(columns):
+                    writer.writerow(row)
+            csv_file.flush()
+
+    # The finished run replaces the csv file of the semester, so changed and deleted courses are updated as well
+    os.replace(partial_path, csv_path)
 
-            # After the driver loads the page, fetch the course data and append the result to the result DataFrame
-            try:
-                result_dataframe.loc[len(result_dataframe)] = get_course_data(driver) + [data_visit]
-            except Exception:
-                pass  # Ignore errors and continue processing
-            # Finally add the visited course link to the closed list, so he wont get visited again
-            closed_link_list.append(data_visit)
-
-        # Check if the last link is unvisited and is not a veranstaltung no "r" indicates that
-        # Note: The courses can be considered as leaves of the DFS tree, whereas the other URLS can be considered as normal nodes
-        elif open_link_list[-1][0] not in closed_link_list:
-            # Deletes the url from the open link list and saves it as next visit url
-            next_visit = open_link_list.pop()[0]
-            print(next_visit)
-            # Try to load the url that need to be visited next
-            try:
-                driver.get(next_visit)
-            except (TimeoutException, ReadTimeoutError,):
-                pass
+    return 0
 
-            # After the site is loaded append it to the closed link list so it will not be visited again
-            closed_link_list.append(next_visit)
+# Former name from the time the catalog was searched depth first, kept for existing callers
+dfs_course_catalog = bfs_course_catalog
 
-            # Now find all relevant urls to other "nodes" of the tree or to all other branches of the course directory
-            current_links = find_links_onsite(driver)
+async def fetch_page(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str, refresh: bool = False
+) -> bytes | None:
+    """
+    Downloads a single page, the semaphore limits the number of pages downloaded at the same time. A request is always
+    sent, pages in the response cache are revalidated with their ETag or Last-Modified header and only unchanged pages
+    (304) are read from disk. Pages without these headers can not be revalidated and are not stored.
 
-            # Add them to the open link list, so they will be visited in future iterations
-            open_link_list = open_link_list + current_links
-        else:
-            open_link_list.pop()[0]
+    Parameters:
+        session (aiohttp.ClientSession): The session with the shared connection pool.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent downloads.
+        url (str): The URL of the page.
+        refresh (bool, optional): Download the page again instead of using the response cache.
 
-    # Save results to a CSV file
-    os.makedirs("Database", exist_ok=True)
-    result_dataframe.to_csv(f"Database/{semester.replace("/","_")}_GoetheUni_Veranstaltungen.csv")
+    Returns:
+        bytes | None: The html of the page or None if the page could not be loaded.
+    """
+    meta, cached_html = (None, None) if refresh else read_cached_response(url)
 
-    return 0
+    async with semaphore:
+        try:
+            async with session.get(url, headers=conditional_headers(meta)) as response:
+                if response.status == 304 and cached_html is not None:
+                    return cached_html
+                response.raise_for_status()
+                html = await response.read()
+                etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+    if etag or last_modified:
+        write_cached_response(url, etag, last_modified, html)
+    return html
+
+async def fetch_pages(urls: list[str], cookies: dict[str, str], refresh: bool = False) -> list[bytes | None]:
+    """
+    Downloads all given pages concurrently. The connections to the QIS server are kept alive and reused, so the
+    handshake is only done for the first requests.
 
-def get_course_data(driver: WebDriver) -> list:
+    Parameters:
+        urls (list[str]): The URLs of the pages.
+        cookies (dict[str, str]): The cookies of the Selenium session.
+        refresh (bool, optional): Download all pages again instead of using the response cache.
+
+    Returns:
+        list[bytes | None]: The html of each page in the same order as the URLs, None for pages not loaded.
+    """
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, keepalive_timeout=30)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(
+        connector=connector, cookies=cookies, timeout=aiohttp.ClientTimeout(total=5)
+    ) as session:
+        return await asyncio.gather(*(fetch_page(session, semaphore, url, refresh) for url in urls))
+
+def element_text(element: lxml.html.HtmlElement) -> str:
+    """Returns the text of an element with collapsed whitespace, like the text of a Selenium element."""
+    return " ".join(element.text_content().split())
+
+def get_course_data(html: bytes) -> list:
     """
     Extracts course-related data from a goethe university course website of the course catalog.
 
     Parameter:
-        driver (WebDriver): The Selenium Webdriver instance with a course website loaded
+        html (bytes): The html of a course website
 
     Returns:
         list: A list containing course information including title, faculties,
@@ -165,38 +344,39 @@ def get_course_data(driver: WebDriver) -> list:
     """
     # Result list
     data = []
+    tree = lxml.html.fromstring(html, parser=HTML_PARSER)
 
     # Get course title
-    course_title_element = driver.find_element(By.XPATH, '//h1')
-    course_title = course_title_element.text.strip().replace(" - Einzelansicht","").replace(";","-").replace(",","-")
+    course_title_element = XPATH_H1(tree)[0]
+    course_title = element_text(course_title_element).replace(" - Einzelansicht","").translate(SANITIZE_TITLE)
     data.append(course_title)
 
     # Get the "Fachbereiche" where the course is listed
     fachbereiche = []
-    fachbereich_elemente = driver.find_elements(By.XPATH, '//div[contains(@style, "padding-left: 10px")]/a')
+    fachbereich_elemente = XPATH_FACHBEREICHE(tree)
     for element in fachbereich_elemente:
-        fachbereiche.append(element.text.strip().replace(";", ","))
+        fachbereiche.append(element_text(element).translate(SANITIZE_SEMICOLON))
     data.append(fachbereiche)
 
     # Extract associated institutions ("Einrichtungen")
-    einrichtungen = driver.find_elements(By.XPATH, '//table[@summary="Übersicht über die zugehörigen Einrichtungen"]//td/a')
-    einrichtungen_liste = [row.text for row in einrichtungen]
+    einrichtungen = XPATH_EINRICHTUNGEN(tree)
+    einrichtungen_liste = [element_text(row) for row in einrichtungen]
     if einrichtungen_liste:
         data.append(einrichtungen_liste)
 
     # Extract responsible and other persons from the "Verantwortliche Dozenten" table
-    tables = driver.find_elements(By.XPATH, '//table[@summary="Verantwortliche Dozenten"]')
+    tables = XPATH_DOZENTEN_TABLES(tree)
     responsible_persons = []
     other_persons = []
 
     #Get data from the Dozenten table
     for table in tables:
-        rows = table.find_elements(By.TAG_NAME, 'tr')[1:]
+        rows = XPATH_ROWS(table)[1:]
         for row in rows:
-            person_element = row.find_element(By.XPATH, './td[@headers="persons_1"]/a')
-            responsibility_element = row.find_element(By.XPATH, './td[@headers="persons_2"]')
-            person_name = person_element.text.strip().replace(";",",").replace(",","<")
-            responsibility = responsibility_element.text.strip().replace(";",",")
+            person_element = XPATH_PERSON(row)[0]
+            responsibility_element = XPATH_RESPONSIBILITY(row)[0]
+            person_name = element_text(person_element).translate(SANITIZE_PERSON)
+            responsibility = element_text(responsibility_element).translate(SANITIZE_SEMICOLON)
             # If they are listed as verantwortlich, extract them as responsible, else as other persons
             if responsibility == "verantwortlich":
                 responsible_persons.append([person_name, responsibility])
@@ -206,23 +386,26 @@ def get_course_data(driver: WebDriver) -> list:
     data.append(other_persons)
 
     # Extract general data from the other table "Grunddaten zur Veranstaltung"
-    tables = driver.find_elements(By.XPATH, '//table[@summary="Grunddaten zur Veranstaltung"]')
+    grunddaten = {}
+    tables = XPATH_GRUNDDATEN_TABLES(tree)
     for table in tables:
-        rows = table.find_elements(By.TAG_NAME, 'tr')
+        rows = XPATH_ROWS(table)
         for row in rows:
             # Find the headers of the table entrys and their values
-            headers = row.find_elements(By.TAG_NAME, 'th')
-            values = row.find_elements(By.TAG_NAME, 'td')
+            headers = XPATH_HEADERS(row)
+            values = XPATH_VALUES(row)
             for header, value in zip(headers, values):
-                header_text = header.text.strip()
-                value_text = value.text.strip().replace(";",",")
-                # Only add certain important fields to the result data
-                if header_text == "Veranstaltungsart" or header_text == "SWS" or header_text == "Credits" or header_text == "Semester" or header_text == "Kürzel":
-                    data.append(value_text)
+                header_text = element_text(header)
+                # Only keep certain important fields, the first value of each field is used
+                if header_text in GRUNDDATEN_FIELD_SET and header_text not in grunddaten:
+                    grunddaten[header_text] = element_text(value).translate(SANITIZE_SEMICOLON)
+
+    # Add the fields in the order of the result columns independent of their order on the page, missing ones stay empty
+    data.extend(grunddaten.get(field, "") for field in GRUNDDATEN_FIELDS)
 
     return data
 
-def find_links_onsite(driver: WebDriver) -> list[Tuple[str, str]]:
+def find_links_onsite(driver: WebDriver) -> Tuple[list[str], list[str]]:
     """Finds all relevant links to courses or other lecture directories.
     This function extracts links from a given webpage that lead either to deeper lecture directories
     or individual courses. Certain unwanted links (e.g., to page views or the general lecture directory)
@@ -232,37 +415,67 @@ def find_links_onsite(driver: WebDriver) -> list[Tuple[str, str]]:
         driver (WebDriver): A Selenium WebDriver object to interact with the webpage.
 
     Returns:
-        List[Tuple[str, str]]: A list of tuples containing the extracted links and their type (node or leaf).
-        - "d" for deeper lecture directories (node)
-        - "r" for regular course links (leaf)
+        Tuple[list[str], list[str]]: The extracted links, separated by their type (node or leaf).
+        - links to deeper lecture directories (node)
+        - links to regular courses (leaf)
+    """
+    # Get url and title of all course links and deeper links by css style, all of them are read in one script call
+    # instead of one WebDriver request per element and attribute
+    return filter_links(*driver.execute_script(FIND_LINKS_SCRIPT))
+
+def find_links_in_page(html: bytes, url: str) -> Tuple[list[str], list[str]]:
+    """Finds all relevant links to courses or other lecture directories in a downloaded page like find_links_onsite.
+
+    Parameters:
+        html (bytes): The html of a lecture directory page.
+        url (str): The URL of the page, relative links are resolved against it.
+
+    Returns:
+        Tuple[list[str], list[str]]: The extracted links to deeper lecture directories and to regular courses.
     """
-    # Define result url list and get all course links and deeper links by css style
-    current_link_list = []
-    deeper_links = driver.find_elements(By.CSS_SELECTOR, "a.ueb")
-    course_links = driver.find_elements(By.CSS_SELECTOR, "a.regular")
+    tree = lxml.html.fromstring(html, base_url=url, parser=HTML_PARSER)
+    tree.make_links_absolute()
+    deeper_links = [(a.get("href"), a.get("title")) for a in XPATH_UEB_LINKS(tree)]
+    course_links = [(a.get("href"), a.get("title")) for a in XPATH_REGULAR_LINKS(tree)]
+    return filter_links(deeper_links, course_links)
+
+def filter_links(
+    deeper_links: list[Tuple[str | None, str | None]], course_links: list[Tuple[str | None, str | None]]
+) -> Tuple[list[str], list[str]]:
+    """Removes the links that lead neither to deeper lecture directories nor to courses.
+
+    Parameters:
+        deeper_links (list[Tuple[str | None, str | None]]): Url and title of the a.ueb links of a page.
+        course_links (list[Tuple[str | None, str | None]]): Url and title of the a.regular links of a page.
+
+    Returns:
+        Tuple[list[str], list[str]]: The links to deeper lecture directories and to regular courses.
+    """
+    # Define result url lists
+    directory_link_list = []
+    course_link_list = []
 
     # Goes deeper link list and deletes the url to the course catalog root (tree root)
-    for link in deeper_links:
-        title = link.get_attribute("title")
+    for href, title in deeper_links:
+        if not href:
+            continue
         if title and "Vorlesungsverzeichnis" in title:
             continue
-        # Add to the result link list with a "d" indicating that the url is not a course url
-        current_link_list.append([link.get_attribute("href"),"d"])
+        # Add to the directory links, the url is not a course url
+        directory_link_list.append(href)
 
     # Goes through the course link list and deletes specifed elements that are no courses
-    for link in course_links:
+    for href, title in course_links:
         # Deletes the Seitenansicht
-        title = link.get_attribute("title")
         if title and "zur Seitenansicht" in title:
             continue
-        # Deletes the url to the start site
-        href = link.get_attribute("href")
-        if href and ("state=user" in href or "category=veranstaltung.browse" in href):
+        # Deletes links without url and the url to the start site
+        if not href or ("state=user" in href or "category=veranstaltung.browse" in href):
             continue
-        # Add to the result link list with a "r" indicating that the url is a course url
-        current_link_list.append([link.get_attribute("href"),"r"])
+        # Add to the course links, the url is a course url
+        course_link_list.append(href)
 
-    return current_link_list
+    return directory_link_list, course_link_list
 
 def get_semester_list():
     """
@@ -274,16 +487,21 @@ def get_semester_list():
     # Initialize the driver with the semester url
     driver = start_driver(url= "https://qis.server.uni-frankfurt.de/qisserver/rds?state=change&type=6&moduleParameter=semesterSelect&nextdir=change&next=SearchSelect.vm&subdir=applications&targettype=7&targetstate=change&getglobal=semester#W")
 
+    # The page is read once and parsed with lxml instead of reading the text of every link through the driver, the
+    # browser is not needed afterwards
+    html = driver.page_source.encode("utf-8")
+    driver.quit()
+    tree = lxml.html.fromstring(html, parser=HTML_PARSER)
+
     # Find all <a> elements with class "regular" that contain semester names
-    semester_elements = driver.find_elements(By.CSS_SELECTOR, 'a.regular')
+    semester_texts = [element_text(element) for element in XPATH_REGULAR_LINKS(tree)]
 
     # Extract and filter the semester names
-    semesters = [element.text.strip() for element in semester_elements if
-                 "Sommer" in element.text or "Winter" in element.text]
+    semesters = [text for text in semester_texts if "Sommer" in text or "Winter" in text]
 
     return semesters
 
-def scrape_institutes(driver: WebDriver, url: str = "https://qis.server.uni-frankfurt.de/qisserver/rds?state=wtree&search=lk&trex=step&rootlk20251=1&P.vx=kurz") -> None:
+def scrape_institutes(driver: WebDriver, url: str = "https://qis.server.uni-frankfurt.de/qisserver/rds?state=wtree&search=lk&trex=step&rootlk20251=1&P.vx=kurz", refresh: bool = False) -> None:
     """
      Scrapes all information about individuals and their affiliated institutes from the personal page of
      the QIS Goethe University Frankfurt
@@ -291,103 +509,146 @@ def scrape_institutes(driver: WebDriver, url: str = "https://qis.server.uni-fran
      Parameters:
          driver (WebDriver): Intialized Selenium driver
          url (str): URL of personal site of QIS Goethe University Frankfurt
+         refresh (bool, optional): Download all pages again instead of using the response cache
      """
-    # Declare result dataframe and intialize url with the driver
-    result_dataframe = pd.DataFrame(columns=["Person","Institut"])
+    # Declare result rows and intialize url with the driver
+    rows = []
     driver.get(url)
 
-    # Find faculty links
-    fachbereich_links = driver.find_elements(By.CLASS_NAME, "ueb")
-    fachbereich_url = [link.get_attribute("href") for link in fachbereich_links]
+    # Find faculty links, their urls are read in one script call instead of one WebDriver request per link
+    fachbereich_url = driver.execute_script(UEB_LINKS_SCRIPT)
+
+    # The faculty and person pages are static tables, they are downloaded concurrently over the kept alive
+    # connections with the session cookies of the driver instead of being loaded one after another in the browser
+    cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+    fachbereich_pages = asyncio.run(fetch_pages(fachbereich_url, cookies, refresh))
     personal_url = []
     # Now iterate over founded fachbereiche urls
-    for fach_url in fachbereich_url:
-        # Try to open them with driver
-        try:
-            driver.get(fach_url)
-        except (TimeoutException, ReadTimeoutError):
-            pass
+    for fach_url, html in zip(fachbereich_url, fachbereich_pages):
         print(fach_url)
+        if html is None:
+            continue
+        # Now get the links to the persons in each Fachbereich and extract their urls
+        tree = lxml.html.fromstring(html, base_url=fach_url, parser=HTML_PARSER)
+        tree.make_links_absolute()
+        personal_url.extend(XPATH_PERSON_LINKS(tree))
 
-        # Now get the links to the persons in each Fachbereich
-        personen_links = driver.find_elements(By.CLASS_NAME, "ver")
-        # Extract their urls
-        personal_url = personal_url + [link.get_attribute("href") for link in personen_links]
     # Now iterate over each of the founded urls
-    for person_url in personal_url:
-        # Load them in the driver
-        try:
-            driver.get(person_url)
-        except (TimeoutException, ReadTimeoutError):
-            pass
+    person_pages = asyncio.run(fetch_pages(personal_url, cookies, refresh))
+    for person_url, html in zip(personal_url, person_pages):
         print(person_url)
-        # Add the information for each person to the result dataframe
-        result_dataframe.loc[len(result_dataframe)] = get_institut_by_person(driver)
+        if html is None:
+            continue
+        # Add the information for each person to the result rows
+        rows.append(get_institut_by_person(html))
 
-    # At the end create Database folder and export the result csv to it
-    os.makedirs("Database", exist_ok=True)
-    result_dataframe.to_csv("Database/Insitutsliste_Goethe_Uni.csv")
+    # At the end build the result dataframe once and export the result csv to the Database folder
+    result_dataframe = pd.DataFrame(rows, columns=["Person","Institut"])
+    result_dataframe.to_csv(DB_DIR / "Insitutsliste_Goethe_Uni.csv", index=False)
 
-def get_institut_by_person(driver: WebDriver) -> Tuple[str, str]:
+def get_institut_by_person(html: bytes) -> Tuple[str, str]:
     """
     Extracts a person's name and associated institute from their profile QIS page.
 
     Parameters:
-        driver (WebDriver): Selenium WebDriver instance with given profile page loaded.
+        html (bytes): The html of the profile page.
 
     Returns:
         Tuple[str, str]: A tuple containing the person's formatted name and their institute.
     """
-    # Retrieve name information and save them with < as seperator
-    try:
-        nachname = driver.find_element(By.XPATH, f"//th[contains(text(), '{"Nachname"}')]/following-sibling::td").text.strip() + " <"
-    except:
-        nachname = ""
-    try:
-        vorname = driver.find_element(By.XPATH, f"//th[contains(text(), '{"Vorname"}')]/following-sibling::td").text.strip()
-    except:
-        vorname = ""
-    try:
-        title = "< " + driver.find_element(By.XPATH, f"//th[contains(text(), '{"Titel"}')]/following-sibling::td").text.strip()
-    except:
-        title = ""
-    try:
-        academic = "< " + driver.find_element(By.XPATH, f"//th[contains(text(), '{"Akad. Grad"}')]/following-sibling::td").text.strip() + "<"
-    except:
-        academic = ""
+    tree = lxml.html.fromstring(html, parser=HTML_PARSER)
+
+    # Retrieve name information and save them with < as seperator, missing fields stay empty
+    def field(header: str) -> str | None:
+        cells = XPATH_PERSON_FIELD(tree, header=header)
+        return element_text(cells[0]) if cells else None
+
+    nachname, vorname, title, academic = field("Nachname"), field("Vorname"), field("Titel"), field("Akad. Grad")
+    nachname = nachname + " <" if nachname is not None else ""
+    vorname = vorname if vorname is not None else ""
+    title = "< " + title if title is not None else ""
+    academic = "< " + academic + "<" if academic is not None else ""
 
     name_format = f"{nachname} {vorname} {title} {academic}"
 
     # Retrieve institute information
-    try:
-        institute = driver.find_element(By.XPATH, '//div[contains(@style, "padding-left: 20px")]/a')
-        first_institute = institute.text.strip()
-    except:
-        first_institute = "Bitte manuell einfügen"  # Default value if institute is not found
+    institute = XPATH_INSTITUTE(tree)
+    # Default value if institute is not found
+    first_institute = element_text(institute[0]) if institute else "Bitte manuell einfügen"
     return (name_format,first_institute)
 
 
-def scrape_semester(semester: str) -> None:
+def scrape_semester(semester: str, driver: WebDriver | None = None, refresh: bool = False) -> None:
     """Scrapes course data for a given semester.
     This function initializes a Selenium WebDriver and retrieves the course catalog for
-    the specified semester (root of tree). Then performs the dfs scpraing function on the tree
+    the specified semester (root of tree). Then performs the bfs scpraing function on the tree
 
     Parameters:
         semester (str): The semester to be scraped (e.g., "WS2024").
+        driver (WebDriver, optional): Already started WebDriver, reusing it for several semesters saves the start of
+                                      the browser and keeps its cache. A new one is started if not given.
+        refresh (bool, optional): Download all pages again instead of using the response cache.
     """
-    driver=start_driver()
+    if driver is None:
+        driver=start_driver()
+    else:
+        driver.get(QIS_START_URL)
     course_cat = get_course_catalog(semester,driver)
-    dfs_course_catalog(course_cat,driver,semester)
+    bfs_course_catalog(course_cat,driver,semester,refresh)
 
-def scrape_personal() -> None:
+def scrape_personal(driver: WebDriver | None = None, refresh: bool = False) -> None:
     """Scrapes personal-related data from the frankfurt university QIS website.
 
     This function initializes a Selenium WebDriver and starts the scraping function for personal and their institutes
+
+    Parameters:
+        driver (WebDriver, optional): Already started WebDriver, e.g. of a previous scrape_semester call. A new one is
+                                      started if not given.
+        refresh (bool, optional): Download all pages again instead of using the response cache.
     """
-    driver=start_driver()
-    scrape_institutes(driver)
+    if driver is None:
+        driver=start_driver()
+    scrape_institutes(driver, refresh=refresh)
+
+def scrape_all(semesters: list[str], workers: int = 4, refresh: bool = False) -> None:
+    """Scrapes the course data of several semesters at the same time.
+    The semesters are independent, each one is scraped in its own process with its own browser and written to its own
+    csv file.
+
+    Parameters:
+        semesters (list[str]): The semesters to be scraped (e.g., ["Winter 2024/25", "Sommer 2024"]).
+        workers (int, optional): Maximum number of semesters scraped at the same time. Should stay small, so the QIS
+                                 server is not overloaded.
+        refresh (bool, optional): Download all pages again instead of using the response cache.
+    """
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(semesters)))) as executor:
+        list(executor.map(scrape_semester_process, semesters, [refresh] * len(semesters)))
+
+def scrape_semester_process(semester: str, refresh: bool = False) -> None:
+    """Scrapes course data for a given semester in a process of scrape_all.
+
+    Parameters:
+        semester (str): The semester to be scraped (e.g., "WS2024").
+        refresh (bool, optional): Download all pages again instead of using the response cache.
+    """
+    # Start the processes shifted, so the browsers do not send their requests at the same time
+    time.sleep(random.uniform(0, START_JITTER_SECONDS))
+
+    # Every browser uses its own http cache, Chrome can not share a cache directory between running instances. The
+    # directories are siblings of the default cache, so they do not mix with the cache files of other browsers
+    driver = start_driver(cache_dir=f"~/.qis_chrome_cache_{semester.replace('/', '_').replace(' ', '_')}")
+    try:
+        scrape_semester(semester, driver, refresh)
+    finally:
+        driver.quit()
 
 
 #semesterliste = ["Winter 2024/25","Winter 2023/24","Sommer 2023","Winter 2022/23","Sommer 2022"]
+#if __name__ == "__main__":
+ #   scrape_all(semesterliste)
+# Or one after another with a single browser:
+#driver = start_driver()
 #for semester in semesterliste:
- #   scrape_semester(semester)
\ No newline at end of file
+ #   scrape_semester(semester, driver)
+#scrape_personal(driver)
+#driver.quit()
\ No newline at end of file
@@ -1,20 +1,70 @@
 """
 Web scraping module for the QIS system of Goethe University Frankfurt.
-Handles all scraping processes. Uses requests and BeautifulSoup to extract course and personnel data from the course catalog.
+Handles all scraping processes. Uses requests, BeautifulSoup and lxml to extract course and personnel data from the course catalog.
 Data is stored as CSV files in the Database/ folder. Alternative to the original selenium webscraper.
 """
 
 import os
-from typing import List, Tuple
-
-import pandas as pd
+import re
+import csv
+import asyncio
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Mapping, Tuple
+
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import lxml.etree
+import lxml.html
+from urllib.parse import parse_qs, urljoin, urlparse
 import unicodedata
 
-
+from response_cache import MAX_CONCURRENT_REQUESTS, conditional_headers, read_cached_response, write_cached_response
+
+
+# The QIS pages are utf-8 encoded, giving the encoding to the parser skips the encoding detection of BeautifulSoup
+HTML_ENCODING = "utf-8"
+HTML_PARSER = lxml.html.HTMLParser(encoding=HTML_ENCODING)
+
+# Text patterns of the BeautifulSoup searches, compiled once. BeautifulSoup matches them with search,
+# so they find the text anywhere in the string like the former "in" tests without calling Python code for each node
+RE_VERANSTALTUNGEN = re.compile("Veranstaltungen")
+RE_VORLESUNGSVERZEICHNIS = re.compile("Vorlesungsverzeichnis")
+
+# Course links to the user page or back to the catalog are skipped, both parts are tested in one regex search
+RE_REJECTED_COURSE_LINK = re.compile(r"state=user|category=veranstaltung\.browse")
+
+# Translation tables for the scraped texts, each text is sanitized in a single pass. Semicolons become commas, in
+# course titles both become "-" and in person names both become "<", the separator of the name parts
+SANITIZE_SEMICOLON = str.maketrans({";": ","})
+SANITIZE_TITLE = str.maketrans({";": "-", ",": "-"})
+SANITIZE_PERSON = str.maketrans({";": "<", ",": "<"})
+
+# XPaths of the catalog and course pages, compiled once at import and reused for every parsed page
+XPATH_UEB_LINKS = lxml.etree.XPath('//a[contains(concat(" ", normalize-space(@class), " "), " ueb ")]')
+XPATH_REGULAR_LINKS = lxml.etree.XPath('//a[contains(concat(" ", normalize-space(@class), " "), " regular ")]')
+XPATH_H1 = lxml.etree.XPath('//h1')
+XPATH_FACHBEREICHE = lxml.etree.XPath('//div[contains(@style, "padding-left: 10px")]')
+XPATH_EINRICHTUNGEN = lxml.etree.XPath('//table[@summary="Übersicht über die zugehörigen Einrichtungen"]//td//a')
+XPATH_DOZENTEN_TABLES = lxml.etree.XPath('//table[@summary="Verantwortliche Dozenten"]')
+XPATH_GRUNDDATEN_TABLES = lxml.etree.XPath('//table[@summary="Grunddaten zur Veranstaltung"]')
+XPATH_ROWS = lxml.etree.XPath('.//tr')
+XPATH_PERSON = lxml.etree.XPath('.//td[contains(concat(" ", normalize-space(@headers), " "), " persons_1 ")]')
+XPATH_RESPONSIBILITY = lxml.etree.XPath('.//td[contains(concat(" ", normalize-space(@headers), " "), " persons_2 ")]')
+XPATH_HEADERS = lxml.etree.XPath('.//th')
+XPATH_VALUES = lxml.etree.XPath('.//td')
+
+# XPaths of the Fachbereich and profile pages, the style tests run in C instead of a Python callback for each div.
+# The field is passed as XPath variable, e.g. XPATH_PERSON_FIELD(tree, field="Nachname")
+XPATH_PERSON_LINKS = lxml.etree.XPath(
+    '//a[contains(concat(" ", normalize-space(@class), " "), " ver ")]/@href', smart_strings=False
+)
+XPATH_PERSON_FIELD = lxml.etree.XPath('(//th[contains(., $field)])[1]/following-sibling::td[1]')
+XPATH_INSTITUTE = lxml.etree.XPath('(//div[contains(@style, "padding-left: 20px")])[1]//a[1]')
 
 
 def get_soup(url: str, session: requests.Session, timeout: int = 10) -> Tuple[str, BeautifulSoup]:
@@ -30,22 +80,143 @@ def get_soup(url: str, session: requests.Session, timeout: int = 10) -> Tuple[st
     Tuple[str, BeautifulSoup] : the response url and the beatiful soup object
 
     """
-    response = session.get(url, timeout=timeout)
+    response_url, html = cached_get(url, session, timeout)
+    # The raw bytes are parsed with the C based lxml parser instead of decoding them first and using html.parser
+    return response_url, BeautifulSoup(html, 'lxml', from_encoding=HTML_ENCODING)
+
+
+def create_session() -> requests.Session:
+    """
+    Creates a requests Session for the QIS server. The connections are kept alive and pooled, so the TCP and TLS
+    handshake is only done once per connection, and failed requests caused by server errors are retried.
+
+    Returns:
+        requests.Session: The configured Session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32, pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+    return session
+
+
+def get_tree(url: str, session: requests.Session, timeout: int = 10) -> Tuple[str, lxml.html.HtmlElement]:
+    """
+    Helper function to get a lxml tree from a URL using requests, the links of the tree are made absolute
+
+    Parameters:
+    url (str) : The url that needs to be loaded
+    session (request.Session) : The current requests session
+    timeout (int) : Seconds after which timeout occurs
+
+    Returns:
+    Tuple[str, lxml.html.HtmlElement] : the response url and the parsed page
+
+    """
+    response_url, html = cached_get(url, session, timeout)
+    return response_url, parse_tree(html, response_url)
+
+
+def cached_get(url: str, session: requests.Session, timeout: int = 10) -> Tuple[str, bytes]:
+    """
+    Downloads a page with a conditional GET. If the page is in the response cache shared with scraper.py, its ETag
+    and Last-Modified date are sent and on 304 Not Modified the stored html is returned instead of downloading it
+    again. A request is always sent, so the navigation pages still change the state of the session on the server.
+
+    Parameters:
+    url (str) : The url that needs to be loaded
+    session (request.Session) : The current requests session
+    timeout (int) : Seconds after which timeout occurs
+
+    Returns:
+    Tuple[str, bytes] : the response url and the html of the page
+
+    """
+    meta, cached_html = read_cached_response(url)
+    response = session.get(url, headers=conditional_headers(meta), timeout=timeout)
+    if response.status_code == 304 and cached_html is not None:
+        return response.url, cached_html
     response.raise_for_status()
-    return response.url, BeautifulSoup(response.text, 'html.parser')
+    store_response(url, response.headers, response.content)
+    return response.url, response.content
 
 
-def start_session(url: str = "https://qis.server.uni-frankfurt.de/qisserver/rds?state=user&type=0") -> Tuple[requests.Session, BeautifulSoup]:
+def store_response(url: str, headers: Mapping[str, str], html: bytes) -> None:
+    """
+    Stores a downloaded page in the response cache, if the server sent an ETag or a Last-Modified date to validate it
+    with. Pages without validators are downloaded on every run anyway and are not stored.
+
+    Parameters:
+    url (str) : The requested url
+    headers (Mapping[str, str]) : The response headers
+    html (bytes) : The html of the page
+
+    """
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if etag or last_modified:
+        write_cached_response(url, etag, last_modified, html)
+
+
+def parse_tree(html: bytes, url: str) -> lxml.html.HtmlElement:
+    """
+    Parses a page with lxml and makes its links absolute.
+
+    Parameters:
+    html (bytes) : The html of the page
+    url (str) : The url of the page, relative links are resolved against it
+
+    Returns:
+    lxml.html.HtmlElement : the parsed page
+
+    """
+    tree = lxml.html.fromstring(html, base_url=url, parser=HTML_PARSER)
+    tree.make_links_absolute()
+    return tree
+
+
+@contextmanager
+def parsed_tree(html: bytes, url: str) -> Iterator[lxml.html.HtmlElement]:
+    """
+    Parses a page like parse_tree and clears the tree when the block is left. The elements of the page are freed
+    right after the extraction, so the memory of the scraper stays flat over thousands of pages.
+
+    Parameters:
+    html (bytes) : The html of the page
+    url (str) : The url of the page, relative links are resolved against it
+
+    Returns:
+    Iterator[lxml.html.HtmlElement] : the parsed page, valid inside the with block
+
+    """
+    tree = parse_tree(html, url)
+    try:
+        yield tree
+    finally:
+        tree.clear()
+
+
+def start_session(
+    url: str = "https://qis.server.uni-frankfurt.de/qisserver/rds?state=user&type=0",
+    session: requests.Session | None = None
+) -> Tuple[requests.Session, BeautifulSoup]:
     """
     Initializes and starts a requests Session with the Goethe University course lecture site as instance.
 
     Parameters:
         url (str, optional): The URL to open. Defaults to the Goethe University course lecture site.
+        session (requests.Session, optional): Already used Session, reusing it keeps its open connections. A new one
+                                              is created if not given.
 
     Returns:
         Tuple[requests.Session, BeautifulSoup]: The initialized Session and the parsed initial page.
     """
-    session = requests.Session()
+    if session is None:
+        session = create_session()
     try:
         current_url, soup = get_soup(url, session, timeout=5)
     except RequestException as e:
@@ -90,7 +261,7 @@ def get_course_catalog(semester_name: str, session: requests.Session, soup: Beau
     new_url, soup = get_soup(new_url, session)
 
     # Navigate to the Veranstaltungen directory on the website
-    link = soup.find("a", string=lambda text: text and "Veranstaltungen" in text)
+    link = soup.find("a", string=RE_VERANSTALTUNGEN)
     if link:
         href = link.get("href")
         new_url = urljoin(base_url, href)
@@ -102,7 +273,7 @@ def get_course_catalog(semester_name: str, session: requests.Session, soup: Beau
             base_url = new_url
 
     # Navigate to the Vorlesungsverzeichnis
-    link = soup.find("a", string=lambda text: text and "Vorlesungsverzeichnis" in text)
+    link = soup.find("a", string=RE_VORLESUNGSVERZEICHNIS)
     if link:
         href = link.get("href")
         new_url = urljoin(base_url, href)
@@ -127,63 +298,176 @@ def dfs_course_catalog(catalog_url: str, session: requests.Session, semester: st
     Returns:
         int: Always returns 0 upon completion.
     """
-    result_dataframe = pd.DataFrame(columns=[
+    columns = [
         'Kursname', 'Fachbereich', 'Zugeordnete Einrichtungen', 'verantwortliche Lehrpersonen',
         'Lehrpersonen', 'Veranstaltungsart', "Kürzel", "Semester", "SWS", "Credits", "Link"
-    ])
-
-    open_link_list: List[Tuple[str, str]] = []
-    closed_link_list: List[str] = []
+    ]
+
+    # Stack of unvisited directories and set of all links found so far. Links are only taken when they are found for
+    # the first time, so no url is opened twice. Course links are leaves and go directly to the course list, so the
+    # stack only holds directories and never more entries than there are unique directory urls
+    open_link_stack: deque[str] = deque()
+    found_link_set: set[str] = set()
+    course_link_list: List[str] = []
+
+    def push_new_links(current_links: List[Tuple[str, str]]) -> None:
+        for link, link_type in current_links:
+            # Courses reached over different paths are only downloaded once, they are compared by their id
+            key = course_key(link) if link_type == "r" else link
+            if key not in found_link_set:
+                found_link_set.add(key)
+                if link_type == "r":
+                    course_link_list.append(link)
+                else:
+                    open_link_stack.append(link)
 
     # Initialize search with start site of Goethe Uni
-    current_url, soup = get_soup(catalog_url, session)
+    try:
+        current_url, tree = get_tree(catalog_url, session)
+    except lxml.etree.LxmlError as e:
+        print(f"Error parsing {catalog_url}: {e}")
+        return 0
 
     # Everything else is the same as in the scraper.py
-    current_links = find_links_onsite(soup)
+    current_links = find_links_onsite(tree)
     print(current_links)
-    open_link_list.extend(current_links)
-
-    while open_link_list:
-        link, link_type = open_link_list[-1]
-        if link_type == "r" and link not in closed_link_list:
-            data_visit = open_link_list.pop()[0]
-            try:
-                page_url, page_soup = get_soup(data_visit, session)
-            except RequestException:
-                pass
-            print(data_visit)
-            try:
-                course_data = get_course_data(page_soup)
-                result_dataframe.loc[len(result_dataframe)] = course_data + [data_visit]
-            except Exception:
-                pass
-            closed_link_list.append(data_visit)
-        elif link not in closed_link_list:
-            next_visit = open_link_list.pop()[0]
-            print(next_visit)
-            try:
-                page_url, page_soup = get_soup(next_visit, session)
-                closed_link_list.append(next_visit)
-            except RequestException:
-                pass
-            closed_link_list.append(next_visit)
-            current_links = find_links_onsite(page_soup)
-            open_link_list.extend(current_links)
-        else:
-            open_link_list.pop()
+    push_new_links(current_links)
+    tree.clear()
 
+    # First only the directories are visited, the courses are the leaves of the tree and are just collected
+    while open_link_stack:
+        link = open_link_stack.pop()
+        print(link)
+        try:
+            page_url, page_tree = get_tree(link, session)
+        except RequestException:
+            continue
+        except lxml.etree.LxmlError as e:
+            print(f"Error parsing {link}: {e}")
+            continue  # Ignore empty or broken pages and continue
+        push_new_links(find_links_onsite(page_tree))
+        # The found links are plain strings, so the page is not needed anymore and its elements are freed
+        page_tree.clear()
+
+    # Then the course pages are independent downloads, they are loaded concurrently with the cookies of the session,
+    # so the selected semester is kept. The results keep the order of the collected links
+    course_rows = asyncio.run(fetch_all(course_link_list, session.cookies.get_dict(), parse_course))
+    rows = [tuple(row) for row in course_rows if row is not None and len(row) == len(columns)]
+
+    # The rows are written directly with csv.writer, a DataFrame of them is never needed
     os.makedirs("Database", exist_ok=True)
-    result_dataframe.to_csv(f"Database/{semester.replace('/', '_')}_GoetheUni_Veranstaltungen.csv")
+    write_csv(f"Database/{semester.replace('/', '_')}_GoetheUni_Veranstaltungen.csv", columns, rows)
 
     return 0
 
 
-def get_course_data(soup: BeautifulSoup) -> list:
+async def fetch_page(
+    session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str, parse: Callable[[bytes, str], object]
+) -> object:
+    """
+    Downloads a single page and parses it. The semaphore limits the number of pages downloaded at the same time, the
+    parsing runs in a worker thread, so the event loop keeps downloading in the meantime.
+
+    Parameters:
+        session (aiohttp.ClientSession): The session with the shared connection pool.
+        semaphore (asyncio.Semaphore): Limits the number of concurrent downloads.
+        url (str): The URL of the page.
+        parse (Callable[[bytes, str], object]): Gets the html and the url of the page and returns the result.
+
+    Returns:
+        object: The result of parse or None if the page could not be loaded.
+    """
+    # Validators are only sent if the html of the page is stored, so a 304 response always has a body to reuse
+    meta, cached_html = read_cached_response(url)
+    async with semaphore:
+        try:
+            async with session.get(url, headers=conditional_headers(meta)) as response:
+                if response.status == 304 and cached_html is not None:
+                    html = cached_html
+                else:
+                    response.raise_for_status()
+                    html = await response.read()
+                    store_response(url, response.headers, html)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+    print(url)
+    return await asyncio.get_running_loop().run_in_executor(None, parse, html, url)
+
+
+async def fetch_all(urls: List[str], cookies: dict, parse: Callable[[bytes, str], object]) -> list:
+    """
+    Downloads and parses all given pages concurrently over one kept alive connection pool.
+
+    Parameters:
+        urls (List[str]): The URLs of the pages.
+        cookies (dict): The cookies of the requests Session.
+        parse (Callable[[bytes, str], object]): Gets the html and the url of a page and returns its result.
+
+    Returns:
+        list: The result of each page in the same order as the URLs, None for pages not loaded.
+    """
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, ttl_dns_cache=300)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(
+        connector=connector, cookies=cookies, timeout=aiohttp.ClientTimeout(total=10)
+    ) as session:
+        return await asyncio.gather(*(fetch_page(session, semaphore, url, parse) for url in urls))
+
+
+def parse_course(html: bytes, url: str) -> list | None:
+    """
+    Extracts the course data of a downloaded course page.
+
+    Parameters:
+        html (bytes): The html of the course page.
+        url (str): The URL of the course page.
+
+    Returns:
+        list | None: The course data with the url as last entry, None if the page could not be read.
+    """
+    try:
+        with parsed_tree(html, url) as tree:
+            return get_course_data(tree) + [url]
+    except Exception:
+        return None
+
+
+def course_key(url: str) -> str:
+    """
+    Returns the key a course link is deduplicated by. Links to the same course differ in their session and
+    navigation parameters, but share the publishid of the course.
+
+    Parameters:
+        url (str): The URL of the course page.
+
+    Returns:
+        str: The publishid of the course, the URL itself if it has none.
+    """
+    return parse_qs(urlparse(url).query).get("publishid", [url])[0]
+
+
+def write_csv(path: str, columns: List[str], rows: List[tuple]) -> None:
+    """
+    Writes the scraped rows to a csv file. Lists in the rows are written as their Python representation, like
+    DataFrame.to_csv did, so Database.py can parse them.
+
+    Parameters:
+        path (str): Path of the csv file.
+        columns (List[str]): The header of the file.
+        rows (List[tuple]): The scraped rows.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+def get_course_data(tree: lxml.html.HtmlElement) -> list:
     """
     Extracts course-related data from a Goethe University course webpage of the course catalog.
 
     Parameter:
-        soup (BeautifulSoup): Parsed HTML of a course page.
+        tree (lxml.html.HtmlElement): Parsed HTML of a course page.
 
     Returns:
         list: A list containing course information including title, faculties,
@@ -193,38 +477,41 @@ def get_course_data(soup: BeautifulSoup) -> list:
     data = []
 
     # Get course title
-    course_title_element = soup.find("h1")
-    course_title = course_title_element.get_text().strip().replace(" - Einzelansicht", "").replace(";", "-").replace(",","-")
+    course_title_element = XPATH_H1(tree)[0]
+    course_title = course_title_element.text_content().strip().replace(" - Einzelansicht", "").translate(SANITIZE_TITLE)
     data.append(course_title)
 
     # Get the "Fachbereiche" where the course is listed
     fachbereiche = []
-    divs = soup.find_all("div", style=lambda s: s and "padding-left: 10px" in s)
+    divs = XPATH_FACHBEREICHE(tree)
     for div in divs:
-        a = div.find("a")
-        if a:
-            fachbereiche.append(a.get_text().strip().replace(";", ","))
+        a = div.find(".//a")
+        if a is not None:
+            fachbereiche.append(a.text_content().strip().translate(SANITIZE_SEMICOLON))
     data.append(fachbereiche)
 
     # Extract associated institutions ("Einrichtungen")
-    einrichtungen_tags = soup.select('table[summary="Übersicht über die zugehörigen Einrichtungen"] td a')
-    einrichtungen_liste = [tag.get_text().strip() for tag in einrichtungen_tags]
+    einrichtungen_tags = XPATH_EINRICHTUNGEN(tree)
+    einrichtungen_liste = [tag.text_content().strip() for tag in einrichtungen_tags]
     data.append(einrichtungen_liste)
 
     # Extract responsible and other persons from the "Verantwortliche Dozenten" table
-    tables = soup.select('table[summary="Verantwortliche Dozenten"]')
+    tables = XPATH_DOZENTEN_TABLES(tree)
     responsible_persons = []
     other_persons = []
     for table in tables:
-        rows = table.find_all("tr")[1:]
+        rows = XPATH_ROWS(table)[1:]
         for row in rows:
-            person_element = row.find("td", headers="persons_1")
-            responsibility_element = row.find("td", headers="persons_2")
-            if person_element and responsibility_element:
-                a = person_element.find("a")
-                person_name = a.get_text().strip().replace(";", ",").replace(",", "<")
-                person_name = unicodedata.normalize("NFKC", person_name)
-                responsibility = responsibility_element.get_text().strip().replace(";", ",")
+            person_elements = XPATH_PERSON(row)
+            responsibility_elements = XPATH_RESPONSIBILITY(row)
+            if person_elements and responsibility_elements:
+                a = person_elements[0].find(".//a")
+                responsibility_element = responsibility_elements[0]
+                person_name = a.text_content().strip().translate(SANITIZE_PERSON)
+                # NFKC does not change pure ascii names, only the others need to be normalized
+                if not person_name.isascii():
+                    person_name = unicodedata.normalize("NFKC", person_name)
+                responsibility = responsibility_element.text_content().strip().translate(SANITIZE_SEMICOLON)
                 if responsibility == "verantwortlich":
                     responsible_persons.append([person_name, responsibility])
                 else:
@@ -233,17 +520,17 @@ def get_course_data(soup: BeautifulSoup) -> list:
     data.append(other_persons)
 
     # Extract general data from the other table "Grunddaten zur Veranstaltung"
-    tables = soup.select('table[summary="Grunddaten zur Veranstaltung"]')
+    tables = XPATH_GRUNDDATEN_TABLES(tree)
     # Initialisiere Felder, falls nicht gefunden
     grunddaten = {"Veranstaltungsart": "", "SWS": "", "Credits": "", "Semester": "", "Kürzel": ""}
     for table in tables:
-        rows = table.find_all("tr")
+        rows = XPATH_ROWS(table)
         for row in rows:
-            headers = row.find_all("th")
-            values = row.find_all("td")
+            headers = XPATH_HEADERS(row)
+            values = XPATH_VALUES(row)
             for header, value in zip(headers, values):
-                header_text = header.get_text().strip()
-                value_text = value.get_text().strip().replace(";", ",")
+                header_text = header.text_content().strip()
+                value_text = value.text_content().strip().translate(SANITIZE_SEMICOLON)
                 # Only add certain important fields to the result data
                 if header_text in grunddaten:
                     grunddaten[header_text] = value_text
@@ -258,7 +545,7 @@ def get_course_data(soup: BeautifulSoup) -> list:
     return data
 
 
-def find_links_onsite(soup: BeautifulSoup) -> List[Tuple[str, str]]:
+def find_links_onsite(tree: lxml.html.HtmlElement) -> List[Tuple[str, str]]:
     """
     Finds all relevant links to courses or other lecture directories.
     This function extracts links from a given webpage that lead either to deeper lecture directories
@@ -266,7 +553,7 @@ def find_links_onsite(soup: BeautifulSoup) -> List[Tuple[str, str]]:
     are explicitly excluded.
 
     Parameters:
-        soup (BeautifulSoup): Parsed HTML of the current page.
+        tree (lxml.html.HtmlElement): Parsed HTML of the current page.
 
     Returns:
         List[Tuple[str, str]]: Eine Liste von Tupeln mit URL und Typ.
@@ -275,38 +562,45 @@ def find_links_onsite(soup: BeautifulSoup) -> List[Tuple[str, str]]:
     """
     # Structure is the same as in scraper.py
     current_link_list: List[Tuple[str, str]] = []
-    deeper_links = soup.find_all("a", class_="ueb")
-    course_links = soup.find_all("a", class_="regular")
+    deeper_links = XPATH_UEB_LINKS(tree)
+    course_links = XPATH_REGULAR_LINKS(tree)
 
     for link in deeper_links:
-        title = link.get("title", "")
-        if "Vorlesungsverzeichnis" in title:
-            continue
         href = link.get("href")
-        if href:
-            current_link_list.append((href, "d"))
+        if not href:
+            continue
+        title = link.get("title")
+        if title and "Vorlesungsverzeichnis" in title:
+            continue
+        current_link_list.append((href, "d"))
 
+    rejected = RE_REJECTED_COURSE_LINK.search
     for link in course_links:
-        title = link.get("title", "")
-        if "zur Seitenansicht" in title:
+        # Links without href are skipped before any other test
+        href = link.get("href")
+        if not href or rejected(href):
             continue
-        href = link.get("href", "")
-        if "state=user" in href or "category=veranstaltung.browse" in href:
+        title = link.get("title")
+        if title and "zur Seitenansicht" in title:
             continue
         current_link_list.append((href, "r"))
 
     return current_link_list
 
 
-def get_semester_list() -> List[str]:
+def get_semester_list(session: requests.Session | None = None) -> List[str]:
     """
     Retrieves a list of available semesters for course lookup.
 
+    Parameters:
+        session (requests.Session, optional): Session to reuse, a new one is created if not given.
+
     Returns:
         list: A list of semester names (e.g., ["Winter 2023/24", "Sommer 2023"]).
     """
     url = "https://qis.server.uni-frankfurt.de/qisserver/rds?state=change&type=6&moduleParameter=semesterSelect&nextdir=change&next=SearchSelect.vm&subdir=applications&targettype=7&targetstate=change&getglobal=semester#W"
-    session = requests.Session()
+    if session is None:
+        session = create_session()
     try:
         _, soup = get_soup(url, session)
     except RequestException:
@@ -325,60 +619,80 @@ def scrape_institutes(session: requests.Session, url: str = "https://qis.server.
         session (requests.Session): Intialized requests session
          url (str): URL of personal site of QIS Goethe University Frankfurt
     """
-    result_dataframe = pd.DataFrame(columns=["Person", "Institut"])
+    rows: List[Tuple[str, str]] = []
     try:
-        _, soup = get_soup(url, session)
-    except RequestException:
+        _, tree = get_tree(url, session)
+    except (RequestException, lxml.etree.LxmlError):
         return
 
-    fachbereich_links = soup.find_all("a", class_="ueb")
+    fachbereich_links = XPATH_UEB_LINKS(tree)
     fachbereich_urls = [link.get("href") for link in fachbereich_links if link.get("href")]
+    tree.clear()
     personal_urls = []
+    cookies = session.cookies.get_dict()
 
-    # Now iterate over founded fachbereiche urls
-    for fach_url in fachbereich_urls:
-        try:
-            _, fach_soup = get_soup(fach_url, session)
-        except RequestException:
-            continue
-        print(fach_url)
-        personen_links = fach_soup.find_all("a", class_="ver")
-        personal_urls.extend([link.get("href") for link in personen_links if link.get("href")])
+    # Now download all founded fachbereiche urls concurrently and collect the links to their persons
+    for person_links in asyncio.run(fetch_all(fachbereich_urls, cookies, parse_person_links)):
+        if person_links is not None:
+            personal_urls.extend(person_links)
 
-    # Now iterate over each of the founded urls
-    for person_url in personal_urls:
-        try:
-            _, person_soup = get_soup(person_url, session)
-        except RequestException:
-            continue
-        print(person_url)
-        try:
-            person_data = get_institut_by_person(person_soup)
-            result_dataframe.loc[len(result_dataframe)] = person_data
-        except Exception:
-            pass
+    # Now download each of the founded urls concurrently
+    for person_data in asyncio.run(fetch_all(personal_urls, cookies, parse_person)):
+        if person_data is not None:
+            rows.append(person_data)
 
+    # All rows are written at once directly with csv.writer
     os.makedirs("Database", exist_ok=True)
-    result_dataframe.to_csv("Database/Insitutsliste_Goethe_Uni.csv")
+    write_csv("Database/Insitutsliste_Goethe_Uni.csv", ["Person", "Institut"], rows)
+
 
+def parse_person_links(html: bytes, url: str) -> List[str]:
+    """
+    Extracts the links to the persons of a downloaded Fachbereich page.
+
+    Parameters:
+        html (bytes): The html of the Fachbereich page.
+        url (str): The URL of the Fachbereich page.
+
+    Returns:
+        List[str]: The URLs of the profile pages.
+    """
+    # The hrefs are selected as plain strings, smart strings would keep a reference to the cleared tree
+    with parsed_tree(html, url) as tree:
+        return [href for href in XPATH_PERSON_LINKS(tree) if href]
+
+
+def parse_person(html: bytes, url: str) -> Tuple[str, str] | None:
+    """
+    Extracts name and institute of a downloaded profile page.
 
-def get_institut_by_person(soup: BeautifulSoup) -> Tuple[str, str]:
+    Parameters:
+        html (bytes): The html of the profile page.
+        url (str): The URL of the profile page.
+
+    Returns:
+        Tuple[str, str] | None: The formatted name and the institute, None if the page could not be read.
+    """
+    try:
+        with parsed_tree(html, url) as tree:
+            return get_institut_by_person(tree)
+    except Exception:
+        return None
+
+
+def get_institut_by_person(tree: lxml.html.HtmlElement) -> Tuple[str, str]:
     """
     Extracts a person's name and associated institute from their QIS profile page.
 
     Parameters:
-        soup (BeautifulSoup): Parsed HTML of the person's profile page.
+        tree (lxml.html.HtmlElement): Parsed HTML of the person's profile page.
 
     Returns:
         Tuple[str, str]: A tuple containing the person's formatted name and their institute.
     """
     def get_field(field_name: str) -> str:
-        th = soup.find("th", string=lambda text: text and field_name in text)
-        if th:
-            td = th.find_next_sibling("td")
-            if td:
-                return td.get_text().strip()
-        return ""
+        cells = XPATH_PERSON_FIELD(tree, field=field_name)
+        return cells[0].text_content().strip() if cells else ""
 
     nachname = get_field("Nachname")
     vorname = get_field("Vorname")
@@ -387,17 +701,14 @@ def get_institut_by_person(soup: BeautifulSoup) -> Tuple[str, str]:
     name_format = f"{nachname} < {vorname} < {title} < {academic}"
     name_format = unicodedata.normalize("NFKC", name_format)
 
-    institute_tag = soup.find("div", style=lambda s: s and "padding-left: 20px" in s)
-    if institute_tag:
-        a = institute_tag.find("a")
-        first_institute = a.get_text().strip() if a else "Bitte manuell einfügen"
-    else:
-        first_institute = "Bitte manuell einfügen"
+    # First link of the first institute div, default value if there is none
+    institute_links = XPATH_INSTITUTE(tree)
+    first_institute = institute_links[0].text_content().strip() if institute_links else "Bitte manuell einfügen"
 
     return (name_format, first_institute)
 
 
-def scrape_semester(semester: str) -> None:
+def scrape_semester(semester: str, session: requests.Session | None = None) -> None:
     """
     Scrapes course data for a given semester.
     Initializes a requests Session, retrieves the course catalog for the specified semester,
@@ -405,22 +716,30 @@ def scrape_semester(semester: str) -> None:
 
     Parameters:
         semester (str): The semester to be scraped (e.g., "WS2024").
+        session (requests.Session, optional): Session to reuse, e.g. for several semesters. A new one is created if
+                                              not given.
     """
-    session, soup = start_session()
+    session, soup = start_session(session=session)
     catalog_url, soup = get_course_catalog(semester, session, soup)
 
     dfs_course_catalog(catalog_url, session, semester)
 
 
-def scrape_personal() -> None:
+def scrape_personal(session: requests.Session | None = None) -> None:
     """
     Scrapes personal-related data from the Frankfurt University QIS website.
     Initializes a requests Session and starts the scraping function for personal data and their institutes.
+
+    Parameters:
+        session (requests.Session, optional): Session to reuse, e.g. of a previous scrape_semester call. A new one is
+                                              created if not given.
     """
-    session, _ = start_session()
+    session, _ = start_session(session=session)
     scrape_institutes(session)
 
 # Beispielhafte Ausführung für verschiedene Semester
 #semesterliste = ["Winter 2024/25", "Winter 2023/24", "Sommer 2023", "Winter 2022/23", "Sommer 2022"]
+#session = create_session()
 #for semester in semesterliste:
-#    scrape_semester(semester)
+#    scrape_semester(semester, session)
+#scrape_personal(session)
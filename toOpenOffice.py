@@ -5,14 +5,48 @@ into structured tables while ensuring proper formatting and alignment.
 """
 
 import os
+from dataclasses import dataclass
 
 from docx import Document
 from docx.shared import Pt
-from docx.table import _Cell
+from docx.table import Table, _Cell
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 import pandas as pd
 
-def fill_word(name: str, semester: str, data: list[str], institute_data: pd.DataFrame) -> Document:
+# Templates and export folder are resolved next to this module, so worker processes of the multi export and
+# starts from another working directory find the same files
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_PATH = os.path.join(MODULE_DIR, "Beispiel.docx")
+TEMPLATE_BIG_PATH = os.path.join(MODULE_DIR, "Beispiel_big.docx")
+EXPORT_DIR = os.path.join(MODULE_DIR, "Word_Exporte")
+
+# Font sizes used in the templates, converted to a docx Length only once
+PT_8 = Pt(8)
+PT_12 = Pt(12)
+
+@dataclass(frozen=True)
+class TextFormat:
+    """
+    Font and alignment settings that are applied to a text written by write_text.
+
+    Attributes:
+        font_name (str): The font name to use.
+        font_size (Pt): The font size as docx Length.
+        italic (bool): Whether the text should be italicized.
+        alignment (WD_PARAGRAPH_ALIGNMENT): The alignment of the paragraph.
+    """
+    font_name: str
+    font_size: Pt
+    italic: bool
+    alignment: WD_PARAGRAPH_ALIGNMENT
+
+# Format of the name, semester and institute at the top of the document
+GENERAL_INFO_FORMAT = TextFormat("Arial", PT_12, False, WD_PARAGRAPH_ALIGNMENT.LEFT)
+
+# Format of the course entries in the course tables
+COURSE_FORMAT = TextFormat("Arial Narrow", PT_8, True, WD_PARAGRAPH_ALIGNMENT.CENTER)
+
+def fill_word(name: str, semester: str, data: list[str], institute_data: dict[str, str]) -> Document:
     """
     Fills the Word document template with general information about the lecturer and his course data.
 
@@ -20,13 +54,13 @@ def fill_word(name: str, semester: str, data: list[str], institute_data: pd.Data
         name (str): The name of the person for whom the document is generated.
         semester (str): The semester information.
         data (list[str]): A list of course data.
-        institute_data (pd.DataFrame): A Dataframe with the lecturers institute data
+        institute_data (dict[str, str]): The institute of each lecturer, see Database.institute_map
 
     Returns:
         Document: The modified result Word document.
     """
     # Select the appropriate template based on the number of courses, select the bigger one if more than 9 courses
-    link = "Beispiel_big.docx" if len(data) > 9 else "Beispiel.docx"
+    link = TEMPLATE_BIG_PATH if len(data) > 9 else TEMPLATE_PATH
 
     # If there is no data do not export as word doc and alternativly do not export if not desired institute
     if len(data) < 1: #or get_institute(name,institute_data) != "Institut für Informatik (IfI):
@@ -46,11 +80,42 @@ def fill_word(name: str, semester: str, data: list[str], institute_data: pd.Data
     doc = write_courses(doc,data)
 
     # Make sure the export directory exists and export the new doc with an appropriate title
-    os.makedirs("Word_Exporte", exist_ok=True)
-    doc.save("Word_Exporte/" + semester.replace(" ", "").replace("/","-") + "_" + name.replace(" ", "_").replace("*","").replace("/","-") + "_Formular_A38.docx")
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    file_name = semester.replace(" ", "").replace("/","-") + "_" + name.replace(" ", "_").replace("*","").replace("/","-") + "_Formular_A38.docx"
+    doc.save(os.path.join(EXPORT_DIR, file_name))
 
     return doc
 
+# Institute data of an export worker process, set once per process by init_export_worker
+_institute_data = None
+
+def init_export_worker(institute_data: dict[str, str]) -> None:
+    """
+    Initializes a worker process of the multi export, the institute data is sent once per process instead of once
+    per document.
+
+    Parameters:
+        institute_data (dict[str, str]): The institute of each lecturer
+    """
+    global _institute_data
+    _institute_data = institute_data
+
+def export_word(name: str, semester: str, data: pd.DataFrame) -> str:
+    """
+    Exports the Word document of one lecturer, used as task of the worker processes in the multi export. The
+    document itself can not be sent back to the main process, so only the name of the lecturer is returned.
+
+    Parameters:
+        name (str): The name of the person for whom the document is generated.
+        semester (str): The semester information.
+        data (pd.DataFrame): The course data of the lecturer.
+
+    Returns:
+        str: The name of the exported lecturer.
+    """
+    fill_word(name, semester, data, _institute_data)
+    return name
+
 def read_word(link: str) -> Document:
     """
     Reads a Word document file and returns the document object.
@@ -82,6 +147,9 @@ def write_courses(doc: Document, data: pd.DataFrame) -> Document:
     # Starting index for insertion into the word table, this number need to be changed when using another word template
     table_index = 20
 
+    # The tables are looked up once for all courses instead of once per course
+    tables = (doc.tables[0], doc.tables[1])
+
     #Iterate through all data in the dataframe, get data for each course and write it in the Word doc
     for row in data.itertuples(index=False):
         course_name = row.Kursname
@@ -93,14 +161,14 @@ def write_courses(doc: Document, data: pd.DataFrame) -> Document:
             ' und weitere' if len(row.Lehrpersonen) > 2 else '') if row.Lehrpersonen else '-'
 
         # Course data is written in to the doc here
-        doc = write_course(table_index,doc,course_name,course_type,course_sws,course_persons,course_sws)
+        write_course(table_index,tables,course_name,course_type,course_sws,course_persons,course_sws)
 
         #Increment index for the next course, increment is by 2 because in the sample file each cell has 2 rows
         table_index = table_index + 2
 
     return doc
 
-def write_general_info(doc: Document, name: str, semester: str, institute_data: pd.DataFrame) -> Document:
+def write_general_info(doc: Document, name: str, semester: str, institute_data: dict[str, str]) -> Document:
     """
     Writes the general information (name and semester) into the first table of the Word document.
 
@@ -108,7 +176,7 @@ def write_general_info(doc: Document, name: str, semester: str, institute_data:
         doc (Document): The sample Word Document that will be filled.
         name (str): The lecturers name that will be inserted at the top of the document.
         semester (str): The semester information to be inserted also at the top of the document.
-        institute_dataframe (pd.DataFrame) : DataFrame with the corresponding data of the lecturers institutes
+        institute_data (dict[str, str]) : The institute of each lecturer
 
     Returns:
         Document: The modified Word document object.
@@ -116,117 +184,102 @@ def write_general_info(doc: Document, name: str, semester: str, institute_data:
     table = doc.tables[0]
 
     # Write name
-    write_text(table.cell(3, 3), f"Name: {name}", font_size=12)
+    write_text(table.cell(3, 3), f"Name: {name}", GENERAL_INFO_FORMAT)
 
     # Write semester
-    write_text(table.cell(5, 3), f"Semester: {semester}", font_size=12)
+    write_text(table.cell(5, 3), f"Semester: {semester}", GENERAL_INFO_FORMAT)
 
     # Write institute
-    write_text(table.cell(5, 15), f"Institut: {get_institute(name,institute_data)}", font_size=12)
+    write_text(table.cell(5, 15), f"Institut: {get_institute(name,institute_data)}", GENERAL_INFO_FORMAT)
 
     return(doc)
 
-def get_institute(name: str, institute_dataframe: pd.DataFrame) -> str:
+def get_institute(name: str, institute_data: dict[str, str]) -> str:
     """
-    Takes a name of a lecturer as input, then search through the personal and institute list in the Database folder and
+    Takes a name of a lecturer as input, then looks up the lecturer in the personal and institute list and
     returns the corresponding institute as string
 
     Parameters:
         name (str) : name string of the lecturer
-        institute_dataframe (pd.DataFrame) : DataFrame with the corresponding data of the lecturers institutes
+        institute_data (dict[str, str]) : The institute of each lecturer, see Database.institute_map
 
     Returns:
         institute (str) or str: institute of the lecturer as string or Bitte manuell einfügen
       """
-    institute = institute_dataframe.loc[institute_dataframe['Person'] == name, 'Institut']
-
-    return institute.iloc[0] if not institute.empty else "Bitte manuell einfügen"
+    return institute_data.get(name, "Bitte manuell einfügen")
 
 def write_course(
     table_index: int,
-    doc: Document,
+    tables: tuple[Table, Table],
     name: str,
     course_type: str,
     sws: int,
     other_teachers: str,
     fullfilled_sws: int
-) -> Document:
+) -> None:
     """
     Writes a single course entry into the appropriate table row in the Word document.
 
     Parameters:
         table_index (int): The row index in the table where the course information should be inserted.
-        doc (Document): The Word document object containing the tables.
+        tables (tuple[Table, Table]): The first and the second table of the Word document.
         name (str): The name of the course.
         course_type (str): The type of course (e.g., lecture, seminar).
         sws (int): The semester weekly hours (SWS) assigned to the course.
         other_teachers (str): The names of additional teachers.
         fulfilled_sws (int): The number of fulfilled semester weekly hours.
-
-    Returns:
-        Document: The modified Word document with the course information added.
     """
-    table = doc.tables[0] # Start with the first table
+    table = tables[0] # Start with the first table
+    rows = table.rows
 
     # Check if the table index is beyond the available rows
-    if table_index >= len(table.rows):
-        table = doc.tables[1] # If beyond: Switch to the second table
+    if table_index >= len(rows):
+        table = tables[1] # If beyond: Switch to the second table
+        rows = table.rows
         table_index = table_index - 33 # Adjust index for the second table
 
-        # If the adjusted index is still out of bounds, return the document unchanged, extremely unlikely to happen
-        if table_index >= len(table.rows):
-            return(doc)
+        # If the adjusted index is still out of bounds, leave the document unchanged, extremely unlikely to happen
+        if table_index >= len(rows):
+            return
 
-    # Insert course details into the correct cells, using specified formatting
-    write_text(table.cell(table_index, 8), str(name),font_name="Arial Narrow", font_size=8, italic=True, align="center")
-    write_text(table.cell(table_index, 12), str(course_type),font_name="Arial Narrow", font_size=8, italic=True, align="center")
-    write_text(table.cell(table_index, 16), str(sws),font_name="Arial Narrow", font_size=8, italic=True, align="center")
-    write_text(table.cell(table_index, 20), str(other_teachers),font_name="Arial Narrow", font_size=8, italic=True, align="center")
-    write_text(table.cell(table_index, 24), str(fullfilled_sws),font_name="Arial Narrow", font_size=8, italic=True, align="center")
+    # The cells of the row are collected once, table.cell would walk the cells of the whole table for every cell
+    row_cells = rows[table_index].cells
 
-    return doc
+    # Insert course details into the correct cells, using specified formatting
+    write_text(row_cells[8], str(name), COURSE_FORMAT)
+    write_text(row_cells[12], str(course_type), COURSE_FORMAT)
+    write_text(row_cells[16], str(sws), COURSE_FORMAT)
+    write_text(row_cells[20], str(other_teachers), COURSE_FORMAT)
+    write_text(row_cells[24], str(fullfilled_sws), COURSE_FORMAT)
 
 
-def write_text(
-        cell: _Cell,
-        text: str,
-        font_name: str = "Arial",
-        font_size: int = 12,
-        italic: bool = False,
-        align: str = "left"
-) -> None:
+def write_text(cell: _Cell, text: str, text_format: TextFormat = GENERAL_INFO_FORMAT) -> None:
     """
-    Writes formatted text into a Word table cell with given font name and size
+    Writes formatted text into a Word table cell with the given text format
 
     Parameters:
         cell (_Cell): The table cell where the text will be inserted.
         text (str): The text to write in the cell.
-        font_name (str, optional): The font name to use (default: "Arial").
-        font_size (int, optional): The font size in points (default: 12).
-        italic (bool, optional): Whether the text should be italicized (default: False).
-        align (str, optional): Text alignment ("left", "center", or "right", default: "left").
+        text_format (TextFormat, optional): Font and alignment of the text (default: GENERAL_INFO_FORMAT).
 
     Returns:
         None
     """
-    # Clear existing text
-    cell.text = ""
+    # Reuse the first paragraph of the cell instead of appending a new one on every write,
+    # its runs are removed while the paragraph formatting of the template is kept
+    paragraph = cell.paragraphs[0].clear()
 
-    # Add a new paragraph and run
-    paragraph = cell.add_paragraph()
-    run = paragraph.add_run(text)
+    # Remove any further paragraphs, so the cell only holds the written text
+    for extra_paragraph in cell.paragraphs[1:]:
+        extra_paragraph._p.getparent().remove(extra_paragraph._p)
 
-    # Set font properties
-    run.font.name = font_name
-    run.font.size = Pt(font_size)
+    run = paragraph.add_run(text)
 
-    # Set italic style if specified
-    run.italic = italic
+    # Set font properties and italic style from the prebuilt format
+    font = run.font
+    font.name = text_format.font_name
+    font.size = text_format.font_size
+    font.italic = text_format.italic
 
     # Set text alignment
-    if align == "center":
-        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    elif align == "right":
-        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
-    else:
-        paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT  #Default setup is left
+    paragraph.alignment = text_format.alignment